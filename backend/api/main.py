@@ -1,15 +1,35 @@
 from contextlib import asynccontextmanager
+import asyncio
 import threading
 import time
 import os
 import logging
+from collections import OrderedDict
 
+import orjson
+import psycopg
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import (
+    FileResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import text as sql_text
-from database import engine, get_db, SessionLocal, Base
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import (
+    DATABASE_URL,
+    PROPOSITIONS_NEW_CHANNEL,
+    engine,
+    async_engine,
+    get_async_db,
+    init_db,
+    AsyncSessionLocal,
+    SessionLocal,
+    Base,
+)
 from models import OrganizationDB, PersonDB, VideoDB, PropositionDB
 from structures import (
     Organization,
@@ -30,125 +50,393 @@ from structures import (
     OrganizationStats,
     VideoStats,
     LeaderboardEntry,
-    RunningAvgPoint,
-    OrgRunningAverage,
     TopOrgsRunningAvgResponse,
 )
-from verifier import verify_proposition
+from verifier import (
+    VerificationResult,
+    close_clients,
+    verify_proposition,
+    verify_propositions_batch_api,
+    verify_propositions_bulk,
+)
 from typing import List, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
-from sqlalchemy import func, case
+from functools import lru_cache, wraps
+from sqlalchemy import (
+    any_,
+    bindparam,
+    func,
+    inspect,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 import uuid
 
 logger = logging.getLogger(__name__)
 
 
-def _model_dump(obj, **kwargs):
-    """Pydantic v1/v2 compatible model serialization."""
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump(**kwargs)
-    return obj.dict(**kwargs)
+# Eager-load everything _prop_to_schema touches so a proposition list is one query.
+_PROP_EAGER = (
+    joinedload(PropositionDB.speaker).joinedload(PersonDB.organization),
+    joinedload(PropositionDB.video),
+)
+_PERSON_EAGER = (joinedload(PersonDB.organization),)
 
+# Conflict target matching the propositions_dedup_key unique index
+_PROP_DEDUP_KEY = (
+    PropositionDB.speaker_id,
+    PropositionDB.video_id,
+    func.md5(PropositionDB.statement),
+)
+
+# Background pass interval; inserts also wake the verifier via NOTIFY
+VERIFY_INTERVAL = 600  # 10 minutes
+# Settle time after a propositions_new wake-up before the pass starts
+NOTIFY_DEBOUNCE = 2.0  # seconds
+# Pause before reopening a dropped LISTEN connection
+VERIFIER_RECONNECT_DELAY = 30  # seconds
+# Session-level advisory lock making the verifier single-writer across workers
+_VERIFIER_TRY_LOCK = sql_text(
+    "SELECT pg_try_advisory_lock(hashtext('veritas.verifier'))"
+)
+_VERIFIER_UNLOCK = sql_text("SELECT pg_advisory_unlock(hashtext('veritas.verifier'))")
+# Readers keep seeing the old rows while it rebuilds
+_REFRESH_ORG_DAY_COUNTS = sql_text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY org_day_counts"
+)
+# API writes that move decided verdicts refresh org_day_counts after this
+# delay; writes landing meanwhile share the refresh
+ORG_DAY_COUNTS_REFRESH_DELAY = 5.0  # seconds
 
-Base.metadata.create_all(bind=engine)
+# Propositions verified and committed together in a background pass
+VERIFY_CHUNK_SIZE = 200
+# Passes with at least this many pending propositions are a backlog, not fresh
+# inserts: their verdicts go through Groq's discounted batch API, waiting up to
+# BATCH_API_DEADLINE per chunk before falling back to live requests
+BATCH_API_MIN_PENDING = 500
+BATCH_API_DEADLINE = 1800  # seconds
+
+# Decided verdicts younger than this are reused for repeats of the same claim
+VERDICT_REUSE_TTL = timedelta(days=30)
 
 
 # --- Background verification job ---
+def _verify_kwargs(p: PropositionDB) -> dict:
+    """Arguments for verify_proposition, read from an eager-loaded proposition."""
+    return dict(
+        statement=p.statement,
+        speaker_name=p.speaker.name,
+        speaker_org=p.speaker.organization.name,
+        video_title=p.video.title,
+        date_stated=p.video.time,
+        verify_at=p.verify_at,
+    )
+
+
+# Plain rows (no ORM instances or identity map) for the verifier's scan; the
+# labels after speaker_id are verify_proposition's keyword arguments.
+_PENDING_VERIFICATION = (
+    select(
+        PropositionDB.id,
+        PropositionDB.speaker_id,
+        PropositionDB.statement,
+        PersonDB.name.label("speaker_name"),
+        OrganizationDB.name.label("speaker_org"),
+        VideoDB.title.label("video_title"),
+        VideoDB.time.label("date_stated"),
+        PropositionDB.verify_at,
+    )
+    .join(PersonDB, PersonDB.id == PropositionDB.speaker_id)
+    .join(OrganizationDB, OrganizationDB.id == PersonDB.organization_id)
+    .join(VideoDB, VideoDB.video_id == PropositionDB.video_id)
+    .where(PropositionDB.verdict.is_(None))
+)
+
+
+def _pending_verify_kwargs(row) -> dict:
+    """Arguments for verify_proposition, read from a _PENDING_VERIFICATION row."""
+    kwargs = row._asdict()
+    del kwargs["id"], kwargs["speaker_id"]
+    return kwargs
+
+
+def _verdict_key(speaker_id: str, statement: str) -> tuple[str, str]:
+    # Mirrors lower(btrim(statement)) in _recent_verdicts
+    return speaker_id, statement.strip(" ").lower()
+
+
+def _recent_verdicts(db: Session, props) -> dict[tuple[str, str], VerificationResult]:
+    """Recent true/false verdicts for the same speaker + normalized statement.
+
+    Speakers repeat claims across videos; those repeats skip the LLM. Keyed per
+    speaker so a verdict never leaks to someone else's claim, and "future" is
+    never reused since it changes as time passes.
+    """
+    norm = func.lower(func.btrim(PropositionDB.statement))
+    keys = {_verdict_key(p.speaker_id, p.statement) for p in props}
+    rows = db.execute(
+        select(
+            PropositionDB.speaker_id,
+            norm,
+            PropositionDB.verdict,
+            PropositionDB.verdict_reasoning,
+        )
+        .where(
+            tuple_(PropositionDB.speaker_id, norm).in_(keys),
+            PropositionDB.verdict.in_(["true", "false"]),
+            PropositionDB.verified_at >= datetime.utcnow() - VERDICT_REUSE_TTL,
+        )
+        .order_by(PropositionDB.verified_at)
+    )
+    # ascending order, so the newest verdict per key wins
+    return {
+        (sid, stmt): VerificationResult(verdict=verdict, reasoning=reasoning or "")
+        for sid, stmt, verdict, reasoning in rows
+    }
+
+
 def _verify_all_unverified():
-    """Verify all propositions with verdict IS NULL."""
+    """Verify all propositions with verdict IS NULL.
+
+    Holds a Postgres advisory lock for the pass so only one worker process
+    verifies at a time; the others return 0 straight away. A pass that
+    verified anything ends by refreshing org_day_counts; verdicts edited via
+    the API schedule their own refresh (_schedule_org_day_counts_refresh).
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not conn.scalar(_VERIFIER_TRY_LOCK):
+            logger.info("Verifier pass already running in another worker")
+            return 0
+        try:
+            count = _verify_unverified()
+            if count:
+                conn.execute(_REFRESH_ORG_DAY_COUNTS)
+                _invalidate_stats_cache()
+            return count
+        finally:
+            conn.execute(_VERIFIER_UNLOCK)
+
+
+def _verify_unverified():
     db = SessionLocal()
     try:
-        props = db.query(PropositionDB).filter(PropositionDB.verdict.is_(None)).all()
+        props = db.execute(_PENDING_VERIFICATION).all()
         if not props:
             return 0
-        count = 0
-        for p in props:
-            try:
-                speaker = db.get(PersonDB, p.speaker_id)
-                org = db.get(OrganizationDB, speaker.organization_id)
-                video = db.get(VideoDB, p.video_id)
-                result = verify_proposition(
-                    statement=p.statement,
-                    speaker_name=speaker.name,
-                    speaker_org=org.name,
-                    video_title=video.title,
-                    date_stated=video.time,
-                    verify_at=p.verify_at,
-                )
-                p.verdict = result["verdict"]
-                p.verdict_reasoning = result["reasoning"]
-                p.verified_at = datetime.utcnow()
-                db.commit()
-                count += 1
-                logger.info(f"Verified proposition {p.id}: {result['verdict']}")
-            except Exception:
-                logger.exception(f"Failed to verify proposition {p.id}")
-                db.rollback()
-        return count
+        return asyncio.run(_verify_pass(db, props))
     finally:
         db.close()
 
 
+async def _verify_pass(db: Session, props: list) -> int:
+    """One background pass on its own asyncio.run loop; the loop's Groq and
+    search clients are closed with it instead of leaking their connections."""
+    try:
+        return await _verify_in_chunks(db, props)
+    finally:
+        await close_clients()
+
+
+async def _verify_in_chunks(db: Session, props: list) -> int:
+    """Verify props VERIFY_CHUNK_SIZE at a time, committing after each chunk,
+    so a crash or DB error loses at most one chunk of paid LLM results.
+
+    Reusable verdicts are looked up per chunk, which keeps the lookup's bind
+    parameters bounded and lets later chunks reuse verdicts from earlier ones.
+    """
+    use_batch_api = len(props) >= BATCH_API_MIN_PENDING
+    if use_batch_api:
+        logger.info(f"{len(props)} pending propositions; using the Groq batch API")
+    verified = 0
+    for start in range(0, len(props), VERIFY_CHUNK_SIZE):
+        chunk = props[start : start + VERIFY_CHUNK_SIZE]
+        cached = _recent_verdicts(db, chunk)
+        pending = [
+            p for p in chunk if _verdict_key(p.speaker_id, p.statement) not in cached
+        ]
+        items = [_pending_verify_kwargs(p) for p in pending]
+        if use_batch_api:
+            fresh = await verify_propositions_batch_api(items, BATCH_API_DEADLINE)
+        else:
+            fresh = await verify_propositions_bulk(items)
+        results = dict(zip((p.id for p in pending), fresh))
+        failed = 0
+        verified_at = datetime.utcnow()
+        rows = []
+        for p in chunk:
+            result = results.get(p.id) or cached[
+                _verdict_key(p.speaker_id, p.statement)
+            ]
+            if isinstance(result, Exception):
+                # verdict stays NULL, so the next run retries it
+                logger.error(f"Failed to verify proposition {p.id}", exc_info=result)
+                failed += 1
+                continue
+            rows.append(
+                {
+                    "id": p.id,
+                    "verdict": result["verdict"],
+                    "verdict_reasoning": result["reasoning"],
+                    "verified_at": verified_at,
+                }
+            )
+        logger.info(
+            f"Verified {len(rows)}/{len(chunk)} propositions "
+            f"({len(chunk) - len(pending)} reused, {failed} failed; "
+            f"{start + len(chunk)}/{len(props)} this pass)"
+        )
+        if rows:
+            # One executemany UPDATE by primary key (pipelined by psycopg) and
+            # one commit per chunk; nothing else runs on this loop meanwhile
+            db.execute(update(PropositionDB), rows)
+            db.commit()
+            _invalidate_stats_cache()
+            verified += len(rows)
+    return verified
+
+
 def _dedup_propositions():
     """Remove duplicate propositions (same speaker_id + statement + video_id), keeping the lowest id."""
-    db = SessionLocal()
-    try:
-        # Find groups with duplicates
-        dupes = (
-            db.query(
-                PropositionDB.speaker_id,
-                PropositionDB.statement,
-                PropositionDB.video_id,
-                func.min(PropositionDB.id).label("keep_id"),
-                func.count(PropositionDB.id).label("cnt"),
+    with engine.begin() as conn:
+        removed = conn.execute(
+            sql_text(
+                "DELETE FROM propositions p USING propositions q "
+                "WHERE p.speaker_id = q.speaker_id AND p.video_id = q.video_id "
+                "AND p.statement = q.statement AND p.id > q.id"
             )
-            .group_by(
-                PropositionDB.speaker_id,
-                PropositionDB.statement,
-                PropositionDB.video_id,
+        ).rowcount
+    if removed:
+        logger.info(f"Dedup: removed {removed} duplicate propositions")
+    return removed
+
+
+def _dedup_organizations():
+    """Merge organizations sharing a name into the lowest id, repointing their
+    people first. Must run before init_db adds organizations_name_key."""
+    with engine.begin() as conn:
+        conn.execute(
+            sql_text(
+                "UPDATE people p SET organization_id = d.keep_id "
+                "FROM (SELECT id, MIN(id) OVER (PARTITION BY name) AS keep_id "
+                "      FROM organizations) d "
+                "WHERE p.organization_id = d.id AND d.id <> d.keep_id"
             )
-            .having(func.count(PropositionDB.id) > 1)
-            .all()
         )
-        removed = 0
-        for row in dupes:
-            extras = (
-                db.query(PropositionDB)
-                .filter(
-                    PropositionDB.speaker_id == row.speaker_id,
-                    PropositionDB.statement == row.statement,
-                    PropositionDB.video_id == row.video_id,
-                    PropositionDB.id != row.keep_id,
-                )
-                .all()
+        removed = conn.execute(
+            sql_text(
+                "DELETE FROM organizations o USING organizations q "
+                "WHERE o.name = q.name AND o.id > q.id"
             )
-            for p in extras:
-                db.delete(p)
-                removed += 1
-        if removed:
-            db.commit()
-            logger.info(f"Dedup: removed {removed} duplicate propositions")
-        return removed
-    finally:
-        db.close()
+        ).rowcount
+    if removed:
+        logger.info(f"Dedup: merged {removed} duplicate organizations")
+    return removed
 
 
-def _background_verifier(stop_event: threading.Event):
-    """Daemon thread that verifies propositions every 10 minutes."""
+def _wait_for_new_propositions(conn, stop_event: threading.Event, timeout: float):
+    """Block until a propositions_new notification, stop_event, or `timeout`.
+
+    Each insert statement notifies, so a burst of single-row posts queues one
+    notification per row. After waking, wait NOTIFY_DEBOUNCE for the burst to
+    settle and drain everything queued, so the burst costs one pass.
+    """
+    deadline = time.monotonic() + timeout
     while not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        # wait in short slices so shutdown isn't held up
+        for _ in conn.notifies(timeout=min(remaining, 1.0), stop_after=1):
+            stop_event.wait(NOTIFY_DEBOUNCE)
+            for _ in conn.notifies(timeout=0):
+                pass
+            return
+
+
+def _listen_connection() -> Optional[psycopg.Connection]:
+    """A connection LISTENing on propositions_new, or None if it can't connect."""
+    try:
+        conn = psycopg.connect(DATABASE_URL, autocommit=True)
+    except psycopg.Error:
+        logger.exception("Verifier could not open its LISTEN connection")
+        return None
+    try:
+        conn.execute(f"LISTEN {PROPOSITIONS_NEW_CHANNEL}")
+    except psycopg.Error:
+        logger.exception("Verifier could not LISTEN")
+        conn.close()
+        return None
+    return conn
+
+
+def _background_verifier(stop_event: threading.Event):
+    """Daemon thread that verifies propositions as soon as new ones are
+    inserted (LISTEN propositions_new), and every 10 minutes regardless.
+
+    A failed or dropped LISTEN connection is logged and reopened before the
+    next wait; until it is back, passes fall back to the plain timed poll.
+    """
+    listen_conn = None
+    try:
+        while not stop_event.is_set():
+            try:
+                n = _verify_all_unverified()
+                if n:
+                    logger.info(f"Background verifier: verified {n} propositions")
+            except Exception:
+                logger.exception("Background verifier error")
+
+            if listen_conn is None or listen_conn.closed:
+                listen_conn = _listen_connection()
+            if listen_conn is None:
+                stop_event.wait(VERIFY_INTERVAL)
+                continue
+            try:
+                _wait_for_new_propositions(listen_conn, stop_event, VERIFY_INTERVAL)
+            except psycopg.Error:
+                logger.exception("Verifier LISTEN connection lost; reconnecting")
+                listen_conn.close()
+                listen_conn = None
+                stop_event.wait(VERIFIER_RECONNECT_DELAY)
+    finally:
+        if listen_conn is not None:
+            listen_conn.close()
+
+
+# Startup creates/upgrades the schema (all idempotent); set SKIP_MIGRATIONS
+# only where another process is known to have done it
+SKIP_MIGRATIONS = bool(os.environ.get("SKIP_MIGRATIONS"))
+# Session-level advisory lock so concurrently starting workers migrate in turn
+_SCHEMA_LOCK = sql_text("SELECT pg_advisory_lock(hashtext('veritas.schema'))")
+_SCHEMA_UNLOCK = sql_text("SELECT pg_advisory_unlock(hashtext('veritas.schema'))")
+
+
+def _migrate():
+    """Create tables, dedup rows the unique indexes need unique, then apply the
+    init_db DDL (indexes, NOTIFY trigger, org_day_counts)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(_SCHEMA_LOCK)
         try:
-            n = _verify_all_unverified()
-            if n:
-                logger.info(f"Background verifier: verified {n} propositions")
-        except Exception:
-            logger.exception("Background verifier error")
-        stop_event.wait(600)  # 10 minutes
+            Base.metadata.create_all(bind=engine)
+            # Dedup before init_db adds the unique indexes on organizations(name)
+            # and propositions
+            _dedup_organizations()
+            _dedup_propositions()
+            init_db()
+        finally:
+            conn.execute(_SCHEMA_UNLOCK)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    _dedup_propositions()
+    if not SKIP_MIGRATIONS:
+        _migrate()
+    await asyncio.to_thread(_refresh_video_index)
+    video_index_task = asyncio.create_task(_video_index_refresher())
     stop_event = threading.Event()
     t = threading.Thread(target=_background_verifier, args=(stop_event,), daemon=True)
     t.start()
@@ -157,42 +445,123 @@ async def lifespan(app: FastAPI):
     stop_event.set()
     t.join(timeout=5)
     logger.info("Background proposition verifier stopped")
+    video_index_task.cancel()
+    await async_engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+# orjson encodes the nested Proposition/Person/Video payloads (and datetimes)
+# several times faster than the stdlib json default.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
+# Comma-separated list of allowed origins, e.g. "https://app.example.com"
+CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*").split(",")
+
+# CORSMiddleware answers preflights itself, before routing; max_age lets
+# browsers cache them for a day instead of re-sending OPTIONS per request.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    max_age=86400,
 )
 
 
 # --- Helpers ---
+def _json_response(content) -> Response:
+    """Encode schema objects (or lists of them) straight to JSON with orjson.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder walk; the route's response_model still documents the shape.
+    """
+    return Response(
+        orjson.dumps(content, default=lambda m: m.model_dump()),
+        media_type="application/json",
+    )
+
+
+# Rows come from our own typed columns, so the *_to_schema helpers use
+# model_construct and skip Pydantic validation.
+@lru_cache(maxsize=1024)
+def _org_schema_cached(
+    id: int, name: str, url: str, logo_url: Optional[str]
+) -> Organization:
+    # Same org repeats across list responses; keyed on every field so edits miss
+    return Organization.model_construct(id=id, name=name, url=url, logo_url=logo_url)
+
+
 def _org_to_schema(org: OrganizationDB) -> Organization:
-    return Organization(id=org.id, name=org.name, url=org.url, logo_url=org.logo_url)
+    return _org_schema_cached(org.id, org.name, org.url, org.logo_url)
 
 
-def _person_to_schema(p: PersonDB, org: OrganizationDB) -> Person:
-    return Person(
-        id=p.id, name=p.name, position=p.position, organization=_org_to_schema(org)
+def _person_to_schema(p: PersonDB) -> Person:
+    return Person.model_construct(
+        id=p.id,
+        name=p.name,
+        position=p.position,
+        organization=_org_to_schema(p.organization),
     )
 
 
+# Locally mirrored videos, served from VIDEO_BASE_URL
+VIDEO_DIR = "/usr/share/vid"
+VIDEO_BASE_URL = "https://vid.totsuki.harvey-l.com/"
+_VIDEO_EXTS = ("mp4", "webm", "mkv")  # later wins when several exist
+# Seconds between checks of VIDEO_DIR; newly mirrored files show up within this
+VIDEO_INDEX_INTERVAL = 30
+# (directory mtime, video_id -> ext)
+_video_files: tuple[Optional[int], dict[str, str]] = (None, {})
+
+
+def _refresh_video_index():
+    """Rescan VIDEO_DIR if its mtime changed (a file was added or removed).
+
+    Blocking filesystem calls; run it in a worker thread, never on the loop.
+    """
+    global _video_files
+    try:
+        mtime = os.stat(VIDEO_DIR).st_mtime_ns
+    except FileNotFoundError:
+        _video_files = (None, {})
+        return
+    if mtime == _video_files[0]:
+        return
+    index: dict[str, str] = {}
+    for entry in os.scandir(VIDEO_DIR):
+        stem, _, ext = entry.name.rpartition(".")
+        if ext in _VIDEO_EXTS and (
+            stem not in index or _VIDEO_EXTS.index(ext) > _VIDEO_EXTS.index(index[stem])
+        ):
+            index[stem] = ext
+    _video_files = (mtime, index)
+
+
+async def _video_index_refresher():
+    while True:
+        await asyncio.sleep(VIDEO_INDEX_INTERVAL)
+        try:
+            await asyncio.to_thread(_refresh_video_index)
+        except OSError:
+            logger.exception("Could not rescan the local video directory")
+
+
+def _local_video_ext(video_id: str) -> Optional[str]:
+    """Extension of the mirrored file for video_id, if any: a dict lookup in
+    the index _video_index_refresher keeps current, no filesystem calls."""
+    return _video_files[1].get(video_id)
+
+
 def _video_to_schema(v: VideoDB) -> Video:
     # transform video url
     video_url = v.video_url
     if "youtube.com/watch?v=" in video_url:
         # https://vid.totsuki.harvey-l.com/<ID>.?
-        exts = ["mp4", "webm", "mkv"]
-        for ext in exts:
-            path = f"/usr/share/vid/{v.video_id}.{ext}"
-            if os.path.exists(path):
-                video_url = "https://vid.totsuki.harvey-l.com/" + v.video_id + "." + ext
+        ext = _local_video_ext(v.video_id)
+        if ext:
+            video_url = f"{VIDEO_BASE_URL}{v.video_id}.{ext}"
 
-    return Video(
+    return Video.model_construct(
         video_id=v.video_id,
         video_path=v.video_path,
         title=v.title,
@@ -203,188 +572,337 @@ def _video_to_schema(v: VideoDB) -> Video:
 
 
 def _prop_to_schema(
-    p: PropositionDB, speaker: PersonDB, org: OrganizationDB, video: VideoDB
+    p: PropositionDB, speaker: Optional[Person] = None, video: Optional[Video] = None
 ) -> Proposition:
-    return Proposition(
+    return Proposition.model_construct(
         id=p.id,
-        speaker=_person_to_schema(speaker, org),
+        speaker=speaker or _person_to_schema(p.speaker),
         statement=p.statement,
         verifyAt=p.verify_at,
-        video=_video_to_schema(video),
+        video=video or _video_to_schema(p.video),
         verdict=p.verdict,
         verdictReasoning=p.verdict_reasoning,
         verifiedAt=p.verified_at,
     )
 
 
+def _memoized_prop_to_schema():
+    """_prop_to_schema that builds each speaker and video schema once and shares
+    it across the propositions of one response."""
+    people: dict[str, Person] = {}
+    videos: dict[str, Video] = {}
+
+    def to_schema(p: PropositionDB) -> Proposition:
+        if p.speaker_id not in people:
+            people[p.speaker_id] = _person_to_schema(p.speaker)
+        if p.video_id not in videos:
+            videos[p.video_id] = _video_to_schema(p.video)
+        return _prop_to_schema(p, people[p.speaker_id], videos[p.video_id])
+
+    return to_schema
+
+
+# Rows fetched per server-side cursor round-trip when streaming list endpoints
+STREAM_BATCH_SIZE = 500
+
+
+async def _stream_json_array(stmt, to_schema):
+    """Emit a JSON array of to_schema(row) one cursor batch at a time.
+
+    Opens its own session: it runs while the response is being sent, after
+    request-scoped dependencies may already have been cleaned up.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream_scalars(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        sep = b"["
+        async for rows in result.partitions():
+            yield sep + b",".join(orjson.dumps(to_schema(r).model_dump()) for r in rows)
+            sep = b","
+        yield b"[]" if sep == b"[" else b"]"
+
+
 # ========== Organization CRUD ==========
 
 
 @app.post("/organizations", response_model=Organization)
-def create_organization(org: OrganizationCreate, db: Session = Depends(get_db)):
+async def create_organization(
+    org: OrganizationCreate, db: AsyncSession = Depends(get_async_db)
+):
     db_org = OrganizationDB(name=org.name, url=org.url, logo_url=org.logo_url)
     db.add(db_org)
-    db.commit()
-    db.refresh(db_org)
+    try:
+        await db.commit()
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Organization already exists")
+    _invalidate_search_cache()
     return _org_to_schema(db_org)
 
 
+# List endpoints whose rows need no Python-side transforms are rendered to JSON
+# by Postgres (json_agg) and passed through as-is.
+_ORGS_JSON_SQL = sql_text("""
+    SELECT COALESCE(json_agg(json_build_object(
+               'id', o.id, 'name', o.name, 'url', o.url, 'logo_url', o.logo_url
+           )), '[]')::text
+    FROM organizations o
+    WHERE o.name <> 'Unknown'
+""")
+
+
 @app.get("/organizations", response_model=List[Organization])
-def list_organizations(db: Session = Depends(get_db)):
-    return [
-        _org_to_schema(o)
-        for o in db.query(OrganizationDB).filter(OrganizationDB.name != "Unknown").all()
-    ]
+async def list_organizations(db: AsyncSession = Depends(get_async_db)):
+    body = await db.scalar(_ORGS_JSON_SQL)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/organizations/{org_id}", response_model=Organization)
-def get_organization(org_id: int, db: Session = Depends(get_db)):
-    org = db.get(OrganizationDB, org_id)
+async def get_organization(org_id: int, db: AsyncSession = Depends(get_async_db)):
+    org = await db.get(OrganizationDB, org_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
     return _org_to_schema(org)
 
 
 @app.put("/organizations/{org_id}", response_model=Organization)
-def update_organization(
-    org_id: int, data: OrganizationUpdate, db: Session = Depends(get_db)
+async def update_organization(
+    org_id: int, data: OrganizationUpdate, db: AsyncSession = Depends(get_async_db)
 ):
-    org = db.get(OrganizationDB, org_id)
+    org = await db.get(OrganizationDB, org_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
-    for field, value in _model_dump(data, exclude_unset=True).items():
+    for field, value in data.model_dump(exclude_unset=True).items():
         setattr(org, field, value)
-    db.commit()
-    db.refresh(org)
+    try:
+        await db.commit()
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Organization already exists")
+    _invalidate_search_cache()
     return _org_to_schema(org)
 
 
 @app.delete("/organizations/{org_id}")
-def delete_organization(org_id: int, db: Session = Depends(get_db)):
-    org = db.get(OrganizationDB, org_id)
+async def delete_organization(
+    org_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    org = await db.get(OrganizationDB, org_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
-    db.delete(org)
-    db.commit()
+    await db.delete(org)
+    await db.commit()
+    _invalidate_search_cache()
     return {"ok": True}
 
 
 # ========== Person CRUD ==========
 
 
-def _resolve_org(db: Session, org_name: str) -> OrganizationDB:
-    """Look up org by name; create if missing."""
-    org = db.query(OrganizationDB).filter(OrganizationDB.name == org_name).first()
-    if not org:
-        org = OrganizationDB(name=org_name, url="")
-        db.add(org)
-        db.commit()
-        db.refresh(org)
-    return org
+async def _resolve_org(db: AsyncSession, org_name: str) -> OrganizationDB:
+    """Look up org by name; create if missing.
+
+    One INSERT ... ON CONFLICT (name) ... RETURNING round-trip. The no-op
+    DO UPDATE (rather than DO NOTHING) makes RETURNING yield existing rows too.
+    """
+    stmt = (
+        pg_insert(OrganizationDB)
+        .values(name=org_name, url="")
+        .on_conflict_do_update(
+            index_elements=[OrganizationDB.name], set_={"name": org_name}
+        )
+        .returning(OrganizationDB)
+    )
+    return (await db.scalars(stmt)).one()
+
+
+async def _resolve_orgs(db: AsyncSession, org_names) -> dict[str, OrganizationDB]:
+    """Look up many orgs by name, creating the missing ones, in one upsert."""
+    names = set(org_names)
+    if not names:
+        return {}
+    stmt = pg_insert(OrganizationDB).values([{"name": n, "url": ""} for n in names])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[OrganizationDB.name], set_={"name": stmt.excluded.name}
+    ).returning(OrganizationDB)
+    return {o.name: o for o in await db.scalars(stmt)}
 
 
 @app.post("/people", response_model=Person)
-def create_person(person: PersonCreate, db: Session = Depends(get_db)):
-    org = _resolve_org(db, person.organization)
+async def create_person(
+    person: PersonCreate, db: AsyncSession = Depends(get_async_db)
+):
+    org = await _resolve_org(db, person.organization)
     person_id = str(uuid.uuid4())
     db_person = PersonDB(
-        id=person_id, name=person.name, position=person.role, organization_id=org.id
+        id=person_id, name=person.name, position=person.role, organization=org
     )
     db.add(db_person)
-    db.commit()
-    db.refresh(db_person)
-    return _person_to_schema(db_person, org)
+    await db.commit()
+    _invalidate_search_cache()
+    return _person_to_schema(db_person)
 
 
-@app.get("/people", response_model=List[Person])
-def list_people(db: Session = Depends(get_db)):
-    people = db.query(PersonDB).all()
-    return [
-        _person_to_schema(p, db.get(OrganizationDB, p.organization_id)) for p in people
+@app.post("/people/bulk", response_model=List[Person])
+async def create_people_bulk(
+    people: List[PersonCreate], db: AsyncSession = Depends(get_async_db)
+):
+    orgs = await _resolve_orgs(db, (p.organization for p in people))
+    rows = [
+        PersonDB(
+            id=str(uuid.uuid4()),
+            name=p.name,
+            position=p.role,
+            organization=orgs[p.organization],
+        )
+        for p in people
     ]
+    db.add_all(rows)
+    await db.flush()
+    result = [_person_to_schema(p) for p in rows]
+    await db.commit()
+    _invalidate_search_cache()
+    return result
+
+
+_PEOPLE_JSON_SQL = sql_text("""
+    SELECT COALESCE(json_agg(json_build_object(
+               'name', p.name,
+               'position', p.position,
+               'id', p.id,
+               'organization', json_build_object(
+                   'id', o.id, 'name', o.name, 'url', o.url, 'logo_url', o.logo_url
+               )
+           )), '[]')::text
+    FROM people p
+    JOIN organizations o ON o.id = p.organization_id
+""")
+
+
+@app.get("/people", response_model=List[Person])
+async def list_people(db: AsyncSession = Depends(get_async_db)):
+    body = await db.scalar(_PEOPLE_JSON_SQL)
+    return Response(content=body, media_type="application/json")
+
+
+# Candidates are collected per table with `%` / ILIKE so each branch can use the
+# gin_trgm_ops indexes; similarity() is only computed on the survivors, and the
+# top :k rows are rendered to JSON by Postgres in score order.
+_SEARCH_PEOPLE_SQL = sql_text("""
+    WITH candidates AS (
+        SELECT p.id
+        FROM people p
+        WHERE p.name % :q
+           OR COALESCE(p.position, '') % :q
+           OR p.name ILIKE '%' || :q || '%'
+           OR COALESCE(p.position, '') ILIKE '%' || :q || '%'
+        UNION
+        SELECT p.id
+        FROM organizations o
+        JOIN people p ON p.organization_id = o.id
+        WHERE o.name % :q
+           OR o.name ILIKE '%' || :q || '%'
+    ),
+    ranked AS (
+        SELECT p.id, p.name, p.position,
+               o.id AS org_id, o.name AS org_name, o.url AS org_url, o.logo_url AS org_logo_url,
+               GREATEST(
+                   similarity(p.name, :q),
+                   similarity(COALESCE(p.position, ''), :q),
+                   similarity(o.name, :q)
+               ) AS score
+        FROM candidates c
+        JOIN people p ON p.id = c.id
+        JOIN organizations o ON o.id = p.organization_id
+        ORDER BY score DESC
+        LIMIT :k
+    )
+    SELECT COALESCE(json_agg(json_build_object(
+               'name', name,
+               'position', position,
+               'id', id,
+               'organization', json_build_object(
+                   'id', org_id, 'name', org_name, 'url', org_url, 'logo_url', org_logo_url
+               )
+           ) ORDER BY score DESC), '[]')::text
+    FROM ranked
+""")
+
+
+SEARCH_CACHE_SIZE = 1024
+# (lowercased q, top_k) -> (table version, JSON body), least recently used first.
+# Every branch of the query is case-insensitive, so case variants share an entry.
+_search_cache: OrderedDict[tuple[str, int], tuple[int, str]] = OrderedDict()
+
+
+def _invalidate_search_cache():
+    """Drop cached searches after a write to people or organizations."""
+    _search_cache.clear()
 
 
 @app.get("/people/search", response_model=List[Person])
-def search_people(
+async def search_people(
     q: str = Query(
         ..., min_length=1, description="Search query (name, position, or org)"
     ),
     top_k: int = Query(5, ge=1, le=50, description="Number of results"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Fuzzy search people by name, position, or organization using trigram similarity + substring matching."""
-    rows = db.execute(
-        sql_text("""
-            SELECT p.id, p.name, p.position,
-                   o.id AS org_id, o.name AS org_name, o.url AS org_url, o.logo_url AS org_logo_url,
-                   GREATEST(
-                       similarity(p.name, :q),
-                       similarity(COALESCE(p.position, ''), :q),
-                       similarity(o.name, :q)
-                   ) AS score
-            FROM people p
-            JOIN organizations o ON o.id = p.organization_id
-            WHERE similarity(p.name, :q) > 0.1
-               OR similarity(COALESCE(p.position, ''), :q) > 0.1
-               OR similarity(o.name, :q) > 0.1
-               OR p.name ILIKE '%' || :q || '%'
-               OR COALESCE(p.position, '') ILIKE '%' || :q || '%'
-               OR o.name ILIKE '%' || :q || '%'
-            ORDER BY score DESC
-            LIMIT :k
-        """),
-        {"q": q, "k": top_k},
-    ).fetchall()
-
-    return [
-        Person(
-            id=row.id,
-            name=row.name,
-            position=row.position,
-            organization=Organization(
-                id=row.org_id,
-                name=row.org_name,
-                url=row.org_url,
-                logo_url=row.org_logo_url,
-            ),
-        )
-        for row in rows
-    ]
+    key = (q.lower(), top_k)
+    # the table version also catches writes made through other workers
+    version = await _current_table_version(db)
+    hit = _search_cache.get(key)
+    if hit and hit[0] == version:
+        _search_cache.move_to_end(key)
+        return Response(content=hit[1], media_type="application/json")
+    # pg_trgm.similarity_threshold is set per connection by async_engine
+    body = await db.scalar(_SEARCH_PEOPLE_SQL, {"q": q, "k": top_k})
+    _search_cache[key] = (version, body)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/people/{person_id}", response_model=Person)
-def get_person(person_id: str, db: Session = Depends(get_db)):
-    p = db.get(PersonDB, person_id)
+async def get_person(person_id: str, db: AsyncSession = Depends(get_async_db)):
+    p = await db.get(PersonDB, person_id, options=_PERSON_EAGER)
     if not p:
         raise HTTPException(status_code=404, detail="Person not found")
-    return _person_to_schema(p, db.get(OrganizationDB, p.organization_id))
+    return _person_to_schema(p)
 
 
 @app.put("/people/{person_id}", response_model=Person)
-def update_person(person_id: str, data: PersonUpdate, db: Session = Depends(get_db)):
-    p = db.get(PersonDB, person_id)
+async def update_person(
+    person_id: str, data: PersonUpdate, db: AsyncSession = Depends(get_async_db)
+):
+    p = await db.get(PersonDB, person_id, options=_PERSON_EAGER)
     if not p:
         raise HTTPException(status_code=404, detail="Person not found")
-    updates = _model_dump(data, exclude_unset=True)
+    updates = data.model_dump(exclude_unset=True)
     if "name" in updates:
         p.name = updates["name"]
     if "role" in updates:
         p.position = updates["role"]
     if "organization" in updates:
-        org = _resolve_org(db, updates["organization"])
-        p.organization_id = org.id
-    db.commit()
-    db.refresh(p)
-    return _person_to_schema(p, db.get(OrganizationDB, p.organization_id))
+        p.organization = await _resolve_org(db, updates["organization"])
+    await db.commit()
+    _invalidate_search_cache()
+    if "organization" in updates:
+        # the person's decided claims now count toward another org
+        _schedule_org_day_counts_refresh()
+    return _person_to_schema(p)
 
 
 @app.delete("/people/{person_id}")
-def delete_person(person_id: str, db: Session = Depends(get_db)):
-    p = db.get(PersonDB, person_id)
+async def delete_person(
+    person_id: str, db: AsyncSession = Depends(get_async_db)
+):
+    p = await db.get(PersonDB, person_id)
     if not p:
         raise HTTPException(status_code=404, detail="Person not found")
-    db.delete(p)
-    db.commit()
+    await db.delete(p)
+    await db.commit()
+    _invalidate_search_cache()
     return {"ok": True}
 
 
@@ -392,103 +910,115 @@ def delete_person(person_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/videos", response_model=Video)
-def create_video(video: VideoCreate, db: Session = Depends(get_db)):
-    db_video = db.get(VideoDB, video.video_id)
-    if db_video:
-        return _video_to_schema(db_video)
-    db_video = VideoDB(**_model_dump(video))
-    db.add(db_video)
-    db.commit()
-    db.refresh(db_video)
+async def create_video(
+    video: VideoCreate, db: AsyncSession = Depends(get_async_db)
+):
+    # Insert-or-skip in one round-trip; only an existing id costs a second read
+    stmt = (
+        pg_insert(VideoDB)
+        .values(**video.model_dump())
+        .on_conflict_do_nothing(index_elements=[VideoDB.video_id])
+        .returning(VideoDB)
+    )
+    db_video = (await db.scalars(stmt)).one_or_none()
+    if db_video is None:
+        db_video = await db.get(VideoDB, video.video_id)
+    await db.commit()
     return _video_to_schema(db_video)
 
 
+@lru_cache(maxsize=32)
+def _parse_statement_analyses(path: str, mtime: float) -> list:
+    """Parse an analysis file once per (path, mtime); rewrites get a new key."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())["statement_analyses"]
+
+
+def _load_statement_analyses(path: str) -> list:
+    return _parse_statement_analyses(path, os.path.getmtime(path))
+
+
 @app.get("/videos/{video_id}/results")
-def stream_json(video_id: str, db: Session = Depends(get_db)):
-    import json
+async def stream_json(video_id: str, db: AsyncSession = Depends(get_async_db)):
+    storage_path = f"{VIDEO_DIR}/{video_id}.json"
+    # file IO (on a cache miss) stays off the event loop
+    analyses = await asyncio.to_thread(_load_statement_analyses, storage_path)
+
+    db_propositions = (
+        await db.scalars(
+            select(PropositionDB)
+            .where(PropositionDB.video_id == video_id)
+            .options(
+                joinedload(PropositionDB.speaker).joinedload(PersonDB.organization)
+            )
+        )
+    ).all()
+    # exact statement match; reversed so the first proposition wins on repeats
+    by_statement = {p.statement: p for p in reversed(db_propositions)}
 
-    storage_path = f"/usr/share/vid/{video_id}.json"
     res = []
+    for e in analyses:
+        # copy: the parsed file is cached and shared between requests
+        e = {
+            k: v
+            for k, v in e.items()
+            if k not in ("speaker_alignment", "speaker_info")
+        }
+        db_prop = by_statement.get(e["statement"])
+        if db_prop:
+            e["speaker"] = _person_to_schema(db_prop.speaker).model_dump()
+            e["verifyAt"] = db_prop.verify_at
+            e["verdict"] = db_prop.verdict
+            e["verdictReasoning"] = db_prop.verdict_reasoning
+            e["verifiedAt"] = db_prop.verified_at
+        else:
+            e["verifyAt"] = None
+            e["verdict"] = None
+            e["verdictReasoning"] = None
+            e["verifiedAt"] = None
+        res.append(e)
 
-    db_propositions = (
-        db.query(PropositionDB)
-        .filter(PropositionDB.video_id == video_id)
-        .options(joinedload(PropositionDB.speaker).joinedload(PersonDB.organization))
-        .all()
-    )
-
-    with open(storage_path) as f:
-        data = json.load(f)
-        data = data["statement_analyses"]
-        for e in data:
-            # find the exact match
-            db_prop = None
-            for p in db_propositions:
-                if p.statement == e["statement"]:
-                    db_prop = p
-                    break
-
-            if db_prop:
-                e["speaker"] = _model_dump(
-                    _person_to_schema(db_prop.speaker, db_prop.speaker.organization)
-                )
-                e["verifyAt"] = (
-                    db_prop.verify_at.isoformat() if db_prop.verify_at else None
-                )
-                e["verdict"] = db_prop.verdict
-                e["verdictReasoning"] = db_prop.verdict_reasoning
-                e["verifiedAt"] = (
-                    db_prop.verified_at.isoformat() if db_prop.verified_at else None
-                )
-            else:
-                e["verifyAt"] = None
-                e["verdict"] = None
-                e["verdictReasoning"] = None
-                e["verifiedAt"] = None
-
-            # del keys speaker_alignment, speaker_info
-            if "speaker_alignment" in e:
-                del e["speaker_alignment"]
-            if "speaker_info" in e:
-                del e["speaker_info"]
-
-            res.append(e)
-
-    return res
+    return ORJSONResponse(res)
 
 
 @app.get("/videos", response_model=List[Video])
-def list_videos(db: Session = Depends(get_db)):
-    return [_video_to_schema(v) for v in db.query(VideoDB).all()]
+async def list_videos():
+    return StreamingResponse(
+        _stream_json_array(select(VideoDB), _video_to_schema),
+        media_type="application/json",
+    )
 
 
 @app.get("/videos/{video_id}", response_model=Video)
-def get_video(video_id: str, db: Session = Depends(get_db)):
-    v = db.get(VideoDB, video_id)
+async def get_video(video_id: str, db: AsyncSession = Depends(get_async_db)):
+    v = await db.get(VideoDB, video_id)
     if not v:
         raise HTTPException(status_code=404, detail="Video not found")
     return _video_to_schema(v)
 
 
 @app.put("/videos/{video_id}", response_model=Video)
-def update_video(video_id: str, data: VideoUpdate, db: Session = Depends(get_db)):
-    v = db.get(VideoDB, video_id)
+async def update_video(
+    video_id: str, data: VideoUpdate, db: AsyncSession = Depends(get_async_db)
+):
+    v = await db.get(VideoDB, video_id)
     if not v:
         raise HTTPException(status_code=404, detail="Video not found")
-    for field, value in _model_dump(data, exclude_unset=True).items():
+    for field, value in data.model_dump(exclude_unset=True).items():
         setattr(v, field, value)
-    db.commit()
-    db.refresh(v)
+    await db.commit()
     return _video_to_schema(v)
 
 
 @app.delete("/videos/{video_id}")
-def delete_video(video_id: str, db: Session = Depends(get_db)):
-    v = db.get(VideoDB, video_id)
+async def delete_video(
+    video_id: str, db: AsyncSession = Depends(get_async_db)
+):
+    v = await db.get(VideoDB, video_id)
     if not v:
         raise HTTPException(status_code=404, detail="Video not found")
-    db.delete(v)
-    db.commit()
+    await db.delete(v)
+    await db.commit()
     return {"ok": True}
 
 
@@ -496,97 +1026,175 @@ def delete_video(video_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/propositions", response_model=Proposition)
-def create_proposition(prop: PropositionCreate, db: Session = Depends(get_db)):
-    speaker = db.get(PersonDB, prop.speaker_id)
+async def create_proposition(
+    prop: PropositionCreate, db: AsyncSession = Depends(get_async_db)
+):
+    speaker = await db.get(PersonDB, prop.speaker_id, options=_PERSON_EAGER)
     if not speaker:
         raise HTTPException(status_code=404, detail="Speaker not found")
-    video = db.get(VideoDB, prop.video_id)
+    video = await db.get(VideoDB, prop.video_id)
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
-    # Dedup: return existing proposition if same speaker+statement+video
-    existing = (
-        db.query(PropositionDB)
-        .filter(
-            PropositionDB.speaker_id == prop.speaker_id,
-            PropositionDB.statement == prop.statement,
-            PropositionDB.video_id == prop.video_id,
+    stmt = (
+        pg_insert(PropositionDB)
+        .values(
+            speaker_id=prop.speaker_id,
+            statement=prop.statement,
+            verify_at=prop.verify_at,
+            video_id=prop.video_id,
         )
-        .first()
+        .on_conflict_do_nothing(index_elements=_PROP_DEDUP_KEY)
+        .returning(PropositionDB)
     )
-    if existing:
-        org = db.get(OrganizationDB, speaker.organization_id)
-        return _prop_to_schema(existing, speaker, org, video)
-    db_prop = PropositionDB(
-        speaker_id=prop.speaker_id,
-        statement=prop.statement,
-        verify_at=prop.verify_at,
-        video_id=prop.video_id,
+    db_prop = (await db.scalars(stmt)).one_or_none()
+    if db_prop is None:
+        # Dedup: return existing proposition if same speaker+statement+video
+        db_prop = await db.scalar(
+            select(PropositionDB).where(
+                PropositionDB.speaker_id == prop.speaker_id,
+                PropositionDB.statement == prop.statement,
+                PropositionDB.video_id == prop.video_id,
+            )
+        )
+    await db.commit()
+    _invalidate_stats_cache()
+    # speaker/video are already loaded; pass them rather than lazy-load
+    return _prop_to_schema(
+        db_prop, _person_to_schema(speaker), _video_to_schema(video)
     )
-    db.add(db_prop)
-    db.commit()
-    db.refresh(db_prop)
-    org = db.get(OrganizationDB, speaker.organization_id)
-    return _prop_to_schema(db_prop, speaker, org, video)
 
 
-@app.get("/propositions", response_model=List[Proposition])
-def list_propositions(db: Session = Depends(get_db)):
-    props = db.query(PropositionDB).all()
+@app.post("/propositions/bulk", response_model=List[Proposition])
+async def create_propositions_bulk(
+    props: List[PropositionCreate], db: AsyncSession = Depends(get_async_db)
+):
+    speakers = {
+        s.id: s
+        for s in await db.scalars(
+            select(PersonDB)
+            .options(*_PERSON_EAGER)
+            .where(PersonDB.id.in_({p.speaker_id for p in props}))
+        )
+    }
+    videos = {
+        v.video_id: v
+        for v in await db.scalars(
+            select(VideoDB).where(VideoDB.video_id.in_({p.video_id for p in props}))
+        )
+    }
+    for prop in props:
+        if prop.speaker_id not in speakers:
+            raise HTTPException(
+                status_code=404, detail=f"Speaker not found: {prop.speaker_id}"
+            )
+        if prop.video_id not in videos:
+            raise HTTPException(
+                status_code=404, detail=f"Video not found: {prop.video_id}"
+            )
+    # Dedup against the table and within the batch (same speaker+statement+video)
+    keys = [(p.speaker_id, p.statement, p.video_id) for p in props]
+    existing = {
+        (e.speaker_id, e.statement, e.video_id): e
+        for e in await db.scalars(
+            select(PropositionDB)
+            .options(*_PROP_EAGER)
+            .where(
+                tuple_(
+                    PropositionDB.speaker_id,
+                    PropositionDB.statement,
+                    PropositionDB.video_id,
+                ).in_(keys)
+            )
+        )
+    }
+    new_rows = []
     results = []
-    for p in props:
-        speaker = db.get(PersonDB, p.speaker_id)
-        org = db.get(OrganizationDB, speaker.organization_id)
-        video = db.get(VideoDB, p.video_id)
-        results.append(_prop_to_schema(p, speaker, org, video))
-    return results
+    for prop, key in zip(props, keys):
+        db_prop = existing.get(key)
+        if db_prop is None:
+            db_prop = PropositionDB(
+                speaker=speakers[prop.speaker_id],
+                statement=prop.statement,
+                verify_at=prop.verify_at,
+                video=videos[prop.video_id],
+            )
+            existing[key] = db_prop
+            new_rows.append(db_prop)
+        results.append(db_prop)
+    db.add_all(new_rows)
+    await db.flush()
+    to_schema = _memoized_prop_to_schema()
+    response = [to_schema(p) for p in results]
+    await db.commit()
+    _invalidate_stats_cache()
+    return response
+
+
+@app.get("/propositions", response_model=List[Proposition])
+async def list_propositions():
+    return StreamingResponse(
+        _stream_json_array(
+            select(PropositionDB).options(*_PROP_EAGER), _memoized_prop_to_schema()
+        ),
+        media_type="application/json",
+    )
 
 
 @app.get("/propositions/{prop_id}", response_model=Proposition)
-def get_proposition(prop_id: int, db: Session = Depends(get_db)):
-    p = db.get(PropositionDB, prop_id)
+async def get_proposition(prop_id: int, db: AsyncSession = Depends(get_async_db)):
+    p = await db.get(PropositionDB, prop_id, options=_PROP_EAGER)
     if not p:
         raise HTTPException(status_code=404, detail="Proposition not found")
-    speaker = db.get(PersonDB, p.speaker_id)
-    org = db.get(OrganizationDB, speaker.organization_id)
-    video = db.get(VideoDB, p.video_id)
-    return _prop_to_schema(p, speaker, org, video)
+    return _prop_to_schema(p)
 
 
 @app.put("/propositions/{prop_id}", response_model=Proposition)
-def update_proposition(
-    prop_id: int, data: PropositionUpdate, db: Session = Depends(get_db)
+async def update_proposition(
+    prop_id: int, data: PropositionUpdate, db: AsyncSession = Depends(get_async_db)
 ):
-    p = db.get(PropositionDB, prop_id)
+    p = await db.get(PropositionDB, prop_id, options=_PROP_EAGER)
     if not p:
         raise HTTPException(status_code=404, detail="Proposition not found")
-    updates = _model_dump(data, exclude_unset=True)
+    updates = data.model_dump(exclude_unset=True)
     if "speaker_id" in updates:
-        if not db.get(PersonDB, updates["speaker_id"]):
+        speaker = await db.get(PersonDB, updates["speaker_id"], options=_PERSON_EAGER)
+        if not speaker:
             raise HTTPException(status_code=404, detail="Speaker not found")
-        p.speaker_id = updates["speaker_id"]
+        p.speaker = speaker
     if "statement" in updates:
         p.statement = updates["statement"]
     if "verify_at" in updates:
         p.verify_at = updates["verify_at"]
     if "video_id" in updates:
-        if not db.get(VideoDB, updates["video_id"]):
+        video = await db.get(VideoDB, updates["video_id"])
+        if not video:
             raise HTTPException(status_code=404, detail="Video not found")
-        p.video_id = updates["video_id"]
-    db.commit()
-    db.refresh(p)
-    speaker = db.get(PersonDB, p.speaker_id)
-    org = db.get(OrganizationDB, speaker.organization_id)
-    video = db.get(VideoDB, p.video_id)
-    return _prop_to_schema(p, speaker, org, video)
+        p.video = video
+    try:
+        await db.commit()
+    except IntegrityError:
+        # propositions_dedup_key: same speaker + video + statement as another row
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Proposition already exists")
+    _invalidate_stats_cache()
+    if p.verdict is not None:
+        _schedule_org_day_counts_refresh()
+    return _prop_to_schema(p)
 
 
 @app.delete("/propositions/{prop_id}")
-def delete_proposition(prop_id: int, db: Session = Depends(get_db)):
-    p = db.get(PropositionDB, prop_id)
+async def delete_proposition(
+    prop_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    p = await db.get(PropositionDB, prop_id)
     if not p:
         raise HTTPException(status_code=404, detail="Proposition not found")
-    db.delete(p)
-    db.commit()
+    had_verdict = p.verdict is not None
+    await db.delete(p)
+    await db.commit()
+    _invalidate_stats_cache()
+    if had_verdict:
+        _schedule_org_day_counts_refresh()
     return {"ok": True}
 
 
@@ -594,32 +1202,25 @@ def delete_proposition(prop_id: int, db: Session = Depends(get_db)):
 
 
 @app.post("/propositions/{prop_id}/verify", response_model=Proposition)
-def verify_single_proposition(prop_id: int, db: Session = Depends(get_db)):
-    p = db.get(PropositionDB, prop_id)
+async def verify_single_proposition(
+    prop_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    p = await db.get(PropositionDB, prop_id, options=_PROP_EAGER)
     if not p:
         raise HTTPException(status_code=404, detail="Proposition not found")
-    speaker = db.get(PersonDB, p.speaker_id)
-    org = db.get(OrganizationDB, speaker.organization_id)
-    video = db.get(VideoDB, p.video_id)
-    result = verify_proposition(
-        statement=p.statement,
-        speaker_name=speaker.name,
-        speaker_org=org.name,
-        video_title=video.title,
-        date_stated=video.time,
-        verify_at=p.verify_at,
-    )
+    result = await verify_proposition(**_verify_kwargs(p))
     p.verdict = result["verdict"]
     p.verdict_reasoning = result["reasoning"]
     p.verified_at = datetime.utcnow()
-    db.commit()
-    db.refresh(p)
-    return _prop_to_schema(p, speaker, org, video)
+    await db.commit()
+    _invalidate_stats_cache()
+    _schedule_org_day_counts_refresh()
+    return _prop_to_schema(p)
 
 
 @app.post("/propositions/verify-all")
-def verify_all_propositions():
-    count = _verify_all_unverified()
+async def verify_all_propositions():
+    count = await asyncio.to_thread(_verify_all_unverified)
     return {"verified": count}
 
 
@@ -627,33 +1228,166 @@ def verify_all_propositions():
 
 
 @app.get("/people/{person_id}/propositions", response_model=List[Proposition])
-def get_propositions_by_person(person_id: str, db: Session = Depends(get_db)):
-    person_db = db.get(PersonDB, person_id)
-    if not person_db:
+async def get_propositions_by_person(
+    person_id: str, db: AsyncSession = Depends(get_async_db)
+):
+    if not await db.get(PersonDB, person_id):
         raise HTTPException(status_code=404, detail="Person not found")
-    org_db = db.get(OrganizationDB, person_db.organization_id)
-    props = db.query(PropositionDB).filter(PropositionDB.speaker_id == person_id).all()
-    return [
-        _prop_to_schema(p, person_db, org_db, db.get(VideoDB, p.video_id))
-        for p in props
-    ]
+    # Lazy loads can't run under AsyncSession, so eager-load everything
+    props = await db.scalars(
+        select(PropositionDB)
+        .options(*_PROP_EAGER)
+        .where(PropositionDB.speaker_id == person_id)
+    )
+    to_schema = _memoized_prop_to_schema()
+    return _json_response([to_schema(p) for p in props])
 
 
 # ========== Stats ==========
 
+# Stats responses are cached as encoded JSON and keyed on a table version drawn
+# from pg_stat_user_tables' write counters, so any insert/update/delete to the
+# underlying tables (from any process) invalidates them.
+STATS_CACHE_TTL = 60  # seconds; upper bound on staleness
+# Keys include client-chosen query params, so the cache is an LRU of this size
+STATS_CACHE_SIZE = 256
+TABLE_VERSION_INTERVAL = 1.0  # seconds between pg_stat_user_tables probes
+
+_TABLE_VERSION_SQL = sql_text(
+    "SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0) "
+    "FROM pg_stat_user_tables "
+    "WHERE relname IN "
+    "('organizations', 'people', 'videos', 'propositions', 'org_day_counts')"
+)
+_table_version = (0.0, None)  # (checked_at, version)
+_stats_cache: OrderedDict[tuple, tuple[float, int, bytes]] = OrderedDict()
+_stats_cache_lock = threading.Lock()
+
+
+async def _current_table_version(db: AsyncSession) -> int:
+    global _table_version
+    checked_at, version = _table_version
+    now = time.monotonic()
+    if version is None or now - checked_at >= TABLE_VERSION_INTERVAL:
+        version = await db.scalar(_TABLE_VERSION_SQL)
+        _table_version = (now, version)
+    return version
+
+
+def _invalidate_stats_cache():
+    """Drop cached stats now; pg_stat counters can lag a write by a second or so."""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+_org_day_counts_dirty = False
+_org_day_counts_refresh: Optional[asyncio.Task] = None
+
+
+def _schedule_org_day_counts_refresh():
+    """Refresh org_day_counts ORG_DAY_COUNTS_REFRESH_DELAY after an API write
+    that changes decided verdicts, instead of waiting for the next verifier
+    pass. Writes during the delay share one refresh; ones arriving while it
+    runs get another. The refresh bumps the table version (org_day_counts is
+    in _TABLE_VERSION_SQL), so every worker's cached stats are dropped.
+    """
+    global _org_day_counts_dirty, _org_day_counts_refresh
+    _org_day_counts_dirty = True
+    if _org_day_counts_refresh is None or _org_day_counts_refresh.done():
+        _org_day_counts_refresh = asyncio.create_task(_refresh_org_day_counts())
 
-def _verdict_counts(props) -> VerdictCounts:
-    counts = VerdictCounts()
-    for p in props:
-        if p.verdict == "true":
-            counts.true += 1
-        elif p.verdict == "false":
-            counts.false += 1
-        elif p.verdict == "future":
-            counts.future += 1
-        else:
-            counts.unverified += 1
-    return counts
+
+async def _refresh_org_day_counts():
+    global _org_day_counts_dirty
+    while _org_day_counts_dirty:
+        await asyncio.sleep(ORG_DAY_COUNTS_REFRESH_DELAY)
+        _org_day_counts_dirty = False
+        try:
+            async with async_engine.connect() as conn:
+                await conn.execute(_REFRESH_ORG_DAY_COUNTS)
+                await conn.commit()
+        except Exception:
+            logger.exception("org_day_counts refresh failed")
+            continue
+        _invalidate_stats_cache()
+
+
+def _cached_stats(handler):
+    """Serve `handler`'s JSON from _stats_cache while the table version holds."""
+
+    @wraps(handler)
+    async def wrapper(**kwargs):
+        params = tuple(sorted((k, v) for k, v in kwargs.items() if k != "db"))
+        key = (handler.__name__, params)
+        version = await _current_table_version(kwargs["db"])
+        with _stats_cache_lock:
+            hit = _stats_cache.get(key)
+            fresh = (
+                hit
+                and hit[1] == version
+                and time.monotonic() - hit[0] < STATS_CACHE_TTL
+            )
+            if fresh:
+                _stats_cache.move_to_end(key)
+        if fresh:
+            return Response(hit[2], media_type="application/json")
+        response = _json_response(await handler(**kwargs))
+        with _stats_cache_lock:
+            _stats_cache[key] = (time.monotonic(), version, response.body)
+            _stats_cache.move_to_end(key)
+            while len(_stats_cache) > STATS_CACHE_SIZE:
+                _stats_cache.popitem(last=False)
+        return response
+
+    return wrapper
+
+
+async def _fetch_many(db: AsyncSession, model, ids, *options) -> dict:
+    """Load rows by primary key with one `pk = ANY(:ids)` query, keyed by pk.
+
+    A single array parameter keeps the statement text (and its cached plan)
+    the same for any number of ids, unlike an expanding IN list.
+    """
+    pk = inspect(model).primary_key[0]
+    ids_param = bindparam("ids", list(ids), type_=ARRAY(pk.type))
+    rows = await db.scalars(
+        select(model).options(*options).where(pk == any_(ids_param))
+    )
+    return {getattr(r, pk.key): r for r in rows}
+
+
+async def _tally_verdicts(db: AsyncSession, stmt) -> tuple[int, VerdictCounts]:
+    """Run `stmt` (selecting verdict, count) grouped by verdict.
+
+    Returns (total, counts).
+    """
+    by_verdict = dict((await db.execute(stmt.group_by(PropositionDB.verdict))).all())
+    total = sum(by_verdict.values())
+    counts = VerdictCounts.model_construct(
+        true=by_verdict.get("true", 0),
+        false=by_verdict.get("false", 0),
+        future=by_verdict.get("future", 0),
+    )
+    counts.unverified = total - counts.true - counts.false - counts.future
+    return total, counts
+
+
+# Per-group verdict tallies, computed by Postgres instead of loading every row
+_VERDICT_TOTALS = (
+    func.count().label("total"),
+    func.count().filter(PropositionDB.verdict == "true").label("n_true"),
+    func.count().filter(PropositionDB.verdict == "false").label("n_false"),
+    func.count().filter(PropositionDB.verdict == "future").label("n_future"),
+)
+
+
+def _counts_from_row(row) -> VerdictCounts:
+    return VerdictCounts.model_construct(
+        true=row.n_true,
+        false=row.n_false,
+        future=row.n_future,
+        unverified=row.total - row.n_true - row.n_false - row.n_future,
+    )
 
 
 def _truth_index(counts: VerdictCounts) -> Optional[float]:
@@ -664,12 +1398,14 @@ def _truth_index(counts: VerdictCounts) -> Optional[float]:
 
 
 @app.get("/stats/overview", response_model=OverallStats)
-def get_overall_stats(db: Session = Depends(get_db)):
+@_cached_stats
+async def get_overall_stats(db: AsyncSession = Depends(get_async_db)):
     """Overall truth index and verdict breakdown across all propositions."""
-    props = db.query(PropositionDB).all()
-    counts = _verdict_counts(props)
-    return OverallStats(
-        total=len(props),
+    total, counts = await _tally_verdicts(
+        db, select(PropositionDB.verdict, func.count())
+    )
+    return OverallStats.model_construct(
+        total=total,
         verified=counts.true + counts.false + counts.future,
         verdictCounts=counts,
         truthIndex=_truth_index(counts),
@@ -677,88 +1413,135 @@ def get_overall_stats(db: Session = Depends(get_db)):
 
 
 @app.get("/stats/by-person", response_model=List[PersonStats])
-def get_stats_by_person(db: Session = Depends(get_db)):
+@_cached_stats
+async def get_stats_by_person(db: AsyncSession = Depends(get_async_db)):
     """Truth index per speaker, sorted by number of propositions descending."""
-    rows = db.query(PropositionDB.speaker_id).group_by(PropositionDB.speaker_id).all()
+    totals = (
+        select(PropositionDB.speaker_id, *_VERDICT_TOTALS)
+        .group_by(PropositionDB.speaker_id)
+        .subquery()
+    )
+    rows = await db.execute(
+        select(PersonDB, *totals.c)
+        .join(totals, totals.c.speaker_id == PersonDB.id)
+        .options(*_PERSON_EAGER)
+        .order_by(totals.c.total.desc())
+    )
     results = []
-    for (speaker_id,) in rows:
-        person = db.get(PersonDB, speaker_id)
-        org = db.get(OrganizationDB, person.organization_id)
-        props = (
-            db.query(PropositionDB).filter(PropositionDB.speaker_id == speaker_id).all()
-        )
-        counts = _verdict_counts(props)
+    for row in rows:
+        counts = _counts_from_row(row)
         results.append(
-            PersonStats(
-                person=_person_to_schema(person, org),
-                total=len(props),
+            PersonStats.model_construct(
+                person=_person_to_schema(row.PersonDB),
+                total=row.total,
                 verdictCounts=counts,
                 truthIndex=_truth_index(counts),
             )
         )
-    results.sort(key=lambda s: s.total, reverse=True)
     return results
 
 
 @app.get("/stats/by-organization", response_model=List[OrganizationStats])
-def get_stats_by_organization(db: Session = Depends(get_db)):
+@_cached_stats
+async def get_stats_by_organization(db: AsyncSession = Depends(get_async_db)):
     """Truth index per organization, sorted by number of propositions descending."""
-    rows = (
-        db.query(PersonDB.organization_id)
+    totals = (
+        select(PersonDB.organization_id, *_VERDICT_TOTALS)
         .join(PropositionDB, PropositionDB.speaker_id == PersonDB.id)
         .group_by(PersonDB.organization_id)
-        .all()
+        .subquery()
+    )
+    rows = await db.execute(
+        select(OrganizationDB, *totals.c)
+        .join(totals, totals.c.organization_id == OrganizationDB.id)
+        .order_by(totals.c.total.desc())
     )
     results = []
-    for (org_id,) in rows:
-        org = db.get(OrganizationDB, org_id)
-        props = (
-            db.query(PropositionDB)
-            .join(PersonDB, PropositionDB.speaker_id == PersonDB.id)
-            .filter(PersonDB.organization_id == org_id)
-            .all()
-        )
-        counts = _verdict_counts(props)
+    for row in rows:
+        counts = _counts_from_row(row)
         results.append(
-            OrganizationStats(
-                organization=_org_to_schema(org),
-                total=len(props),
+            OrganizationStats.model_construct(
+                organization=_org_to_schema(row.OrganizationDB),
+                total=row.total,
                 verdictCounts=counts,
                 truthIndex=_truth_index(counts),
             )
         )
-    results.sort(key=lambda s: s.total, reverse=True)
     return results
 
 
 @app.get("/stats/by-video", response_model=List[VideoStats])
-def get_stats_by_video(db: Session = Depends(get_db)):
+@_cached_stats
+async def get_stats_by_video(db: AsyncSession = Depends(get_async_db)):
     """Truth index per video, sorted by number of propositions descending."""
-    rows = db.query(PropositionDB.video_id).group_by(PropositionDB.video_id).all()
+    totals = (
+        select(PropositionDB.video_id, *_VERDICT_TOTALS)
+        .group_by(PropositionDB.video_id)
+        .subquery()
+    )
+    rows = await db.execute(
+        select(VideoDB, *totals.c)
+        .join(totals, totals.c.video_id == VideoDB.video_id)
+        .order_by(totals.c.total.desc())
+    )
     results = []
-    for (video_id,) in rows:
-        video = db.get(VideoDB, video_id)
-        props = db.query(PropositionDB).filter(PropositionDB.video_id == video_id).all()
-        counts = _verdict_counts(props)
+    for row in rows:
+        counts = _counts_from_row(row)
         results.append(
-            VideoStats(
-                video=_video_to_schema(video),
-                total=len(props),
+            VideoStats.model_construct(
+                video=_video_to_schema(row.VideoDB),
+                total=row.total,
                 verdictCounts=counts,
                 truthIndex=_truth_index(counts),
             )
         )
-    results.sort(key=lambda s: s.total, reverse=True)
     return results
 
 
+# Per-speaker tallies and the Bayesian prior (C, m) are computed in one pass;
+# Postgres ranks and limits, so only the returned speakers are hydrated.
+_LEADERBOARD_SQL_TEMPLATE = """
+WITH agg AS (
+    SELECT speaker_id,
+           COUNT(*) AS total,
+           COUNT(*) FILTER (WHERE verdict = 'true') AS n_true,
+           COUNT(*) FILTER (WHERE verdict = 'false') AS n_false
+    FROM propositions
+    GROUP BY speaker_id
+),
+prior AS (
+    SELECT SUM(n_true + n_false)::float / COUNT(*) AS c,
+           SUM(n_true)::float / NULLIF(SUM(n_true + n_false), 0) AS m
+    FROM agg
+)
+SELECT a.speaker_id,
+       a.total::int AS total,
+       a.n_true::int AS n_true,
+       a.n_false::int AS n_false,
+       round(((p.c * p.m + a.n_true) / (p.c + a.n_true + a.n_false))::numeric, 4)
+           AS truth_index
+FROM agg a, prior p
+WHERE p.m IS NOT NULL AND a.n_true + a.n_false >= :min_claims
+ORDER BY truth_index {direction}, a.total {direction}
+LIMIT :limit
+"""
+_LEADERBOARD_SQL = {
+    "most_honest": sql_text(_LEADERBOARD_SQL_TEMPLATE.format(direction="DESC")),
+    "biggest_liars": sql_text(_LEADERBOARD_SQL_TEMPLATE.format(direction="ASC")),
+}
+
+
 @app.get("/stats/leaderboard", response_model=List[LeaderboardEntry])
-def get_truth_leaderboard(
+@_cached_stats
+async def get_truth_leaderboard(
     order: str = Query("most_honest", regex="^(most_honest|biggest_liars)$"),
     min_claims: int = Query(
         1, ge=1, description="Minimum true+false claims to qualify"
     ),
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Return only the first N ranked speakers"
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Rank speakers by truth index using a **Bayesian average**.
 
@@ -778,98 +1561,106 @@ def get_truth_leaderboard(
     `most_honest` = highest truth index first,
     `biggest_liars` = lowest truth index first.
     Only includes speakers with at least `min_claims` decided (true/false)
-    propositions."""
-
-    # -- gather per-speaker counts in a single pass --
-    rows = db.query(PropositionDB.speaker_id).group_by(PropositionDB.speaker_id).all()
-    speaker_data: list[tuple] = []  # (speaker_id, counts, decided)
-    global_true_sum = 0
-    global_decided_sum = 0
+    propositions; `limit` caps the number of entries returned."""
 
-    for (speaker_id,) in rows:
-        props = (
-            db.query(PropositionDB).filter(PropositionDB.speaker_id == speaker_id).all()
+    rows = (
+        await db.execute(
+            _LEADERBOARD_SQL[order], {"min_claims": min_claims, "limit": limit}
         )
-        counts = _verdict_counts(props)
-        decided = counts.true + counts.false
-        speaker_data.append((speaker_id, counts, len(props), decided))
-        global_true_sum += counts.true
-        global_decided_sum += decided
-
-    # -- compute Bayesian prior --
-    num_speakers = len(speaker_data)
-    if num_speakers == 0 or global_decided_sum == 0:
-        return []
-    C = global_decided_sum / num_speakers  # avg decided claims per speaker
-    m = global_true_sum / global_decided_sum  # global truth ratio
-
-    # -- build leaderboard entries --
-    entries: list[LeaderboardEntry] = []
-    for speaker_id, counts, total, decided in speaker_data:
-        if decided < min_claims:
-            continue
-        bayesian_ti = round((C * m + counts.true) / (C + decided), 4)
-        person = db.get(PersonDB, speaker_id)
-        org = db.get(OrganizationDB, person.organization_id)
-        entries.append(
-            LeaderboardEntry(
-                person=_person_to_schema(person, org),
-                truthIndex=bayesian_ti,
-                total=total,
-                trueCount=counts.true,
-                falseCount=counts.false,
-            )
+    ).all()
+    people = await _fetch_many(
+        db, PersonDB, (row.speaker_id for row in rows), *_PERSON_EAGER
+    )
+    return [
+        LeaderboardEntry.model_construct(
+            person=_person_to_schema(people[row.speaker_id]),
+            truthIndex=float(row.truth_index),
+            total=row.total,
+            trueCount=row.n_true,
+            falseCount=row.n_false,
         )
-
-    reverse = order == "most_honest"
-    entries.sort(key=lambda e: (e.truthIndex or 0, e.total), reverse=reverse)
-    return entries
+        for row in rows
+    ]
 
 
 @app.get("/people/{person_id}/stats", response_model=PersonStats)
-def get_person_stats(person_id: str, db: Session = Depends(get_db)):
+async def get_person_stats(person_id: str, db: AsyncSession = Depends(get_async_db)):
     """Truth index and verdict breakdown for a single speaker."""
-    person = db.get(PersonDB, person_id)
+    person = await db.get(PersonDB, person_id, options=_PERSON_EAGER)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
-    org = db.get(OrganizationDB, person.organization_id)
-    props = db.query(PropositionDB).filter(PropositionDB.speaker_id == person_id).all()
-    counts = _verdict_counts(props)
-    return PersonStats(
-        person=_person_to_schema(person, org),
-        total=len(props),
+    total, counts = await _tally_verdicts(
+        db,
+        select(PropositionDB.verdict, func.count()).where(
+            PropositionDB.speaker_id == person_id
+        ),
+    )
+    return PersonStats.model_construct(
+        person=_person_to_schema(person),
+        total=total,
         verdictCounts=counts,
         truthIndex=_truth_index(counts),
     )
 
 
 @app.get("/organizations/{org_id}/stats", response_model=OrganizationStats)
-def get_organization_stats(org_id: int, db: Session = Depends(get_db)):
+async def get_organization_stats(
+    org_id: int, db: AsyncSession = Depends(get_async_db)
+):
     """Truth index and verdict breakdown for a single organization."""
-    org = db.get(OrganizationDB, org_id)
+    org = await db.get(OrganizationDB, org_id)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
-    props = (
-        db.query(PropositionDB)
+    total, counts = await _tally_verdicts(
+        db,
+        select(PropositionDB.verdict, func.count())
         .join(PersonDB, PropositionDB.speaker_id == PersonDB.id)
-        .filter(PersonDB.organization_id == org_id)
-        .all()
+        .where(PersonDB.organization_id == org_id),
     )
-    counts = _verdict_counts(props)
-    return OrganizationStats(
+    return OrganizationStats.model_construct(
         organization=_org_to_schema(org),
-        total=len(props),
+        total=total,
         verdictCounts=counts,
         truthIndex=_truth_index(counts),
     )
 
 
+# Reads the org_day_counts materialized view (per-org daily tallies of decided
+# claims). It is refreshed after each verifier pass and
+# ORG_DAY_COUNTS_REFRESH_DELAY after API writes that move decided verdicts, so
+# it trails those by a few seconds (plus the refresh time).
+# Step 1+2: rank orgs by truth index over days since :since and keep the top N.
+# Step 3: running totals over each selected org's days via a window.
+_TOP_ORGS_RUNNING_AVG_SQL = sql_text("""
+WITH top AS (
+    SELECT org_id,
+           row_number() OVER (
+               ORDER BY SUM(n_true)::float / SUM(n_decided) DESC, org_id
+           ) AS rank
+    FROM org_day_counts
+    WHERE day >= :since
+    GROUP BY org_id
+    ORDER BY rank
+    LIMIT :top_n
+)
+SELECT d.org_id,
+       d.day,
+       (SUM(d.n_true) OVER w)::bigint AS cum_true,
+       (SUM(d.n_decided) OVER w)::bigint AS cum_decided
+FROM org_day_counts d
+JOIN top t ON t.org_id = d.org_id
+WINDOW w AS (PARTITION BY d.org_id ORDER BY d.day)
+ORDER BY t.rank, d.day
+""")
+
+
 @app.get("/stats/top-orgs-running-avg", response_model=TopOrgsRunningAvgResponse)
-def get_top_orgs_running_avg(
+@_cached_stats
+async def get_top_orgs_running_avg(
     top_n: int = Query(
         5, ge=1, le=50, description="Number of top organizations to return"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Return the running-average truth index for the top N organizations.
 
@@ -881,98 +1672,53 @@ def get_top_orgs_running_avg(
        index from the earliest proposition date to the latest, emitting one
        data-point per calendar day that has at least one decided proposition.
     """
-    now = datetime.utcnow()
-    one_year_ago = now - timedelta(days=365)
-
-    # -- Step 1: collect all orgs and their decided propositions in the last year --
-    recent_props = (
-        db.query(PropositionDB, PersonDB.organization_id)
-        .join(PersonDB, PropositionDB.speaker_id == PersonDB.id)
-        .filter(
-            PropositionDB.verify_at >= one_year_ago,
-            PropositionDB.verdict.in_(["true", "false"]),
+    one_year_ago = (datetime.utcnow() - timedelta(days=365)).date()
+    rows = (
+        await db.execute(
+            _TOP_ORGS_RUNNING_AVG_SQL,
+            {"since": one_year_ago, "top_n": top_n},
         )
-        .all()
-    )
-
-    org_recent: dict[int, dict] = defaultdict(lambda: {"true": 0, "decided": 0})
-    for prop, org_id in recent_props:
-        org_recent[org_id]["decided"] += 1
-        if prop.verdict == "true":
-            org_recent[org_id]["true"] += 1
-
-    # truth index for last year per org
-    org_recent_ti: dict[int, float] = {}
-    for org_id, c in org_recent.items():
-        if c["decided"] > 0:
-            org_recent_ti[org_id] = c["true"] / c["decided"]
-
-    if not org_recent_ti:
-        return TopOrgsRunningAvgResponse(topN=top_n, organizations=[])
-
-    # -- Step 2: pick top N by recent truth index --
-    sorted_orgs = sorted(org_recent_ti.items(), key=lambda x: x[1], reverse=True)
-    top_org_ids = [org_id for org_id, _ in sorted_orgs[:top_n]]
-
-    # -- Step 3: running average from earliest to latest for each top org --
-    all_props = (
-        db.query(PropositionDB, PersonDB.organization_id)
-        .join(PersonDB, PropositionDB.speaker_id == PersonDB.id)
-        .filter(
-            PersonDB.organization_id.in_(top_org_ids),
-            PropositionDB.verdict.in_(["true", "false"]),
+    ).all()
+    if not rows:
+        return {"topN": top_n, "organizations": []}
+
+    # The series is the bulk of this payload (one point per org-day), so it is
+    # built as plain dicts in the TopOrgsRunningAvgResponse shape and handed
+    # to orjson directly rather than going through a model per point.
+    # rows arrive ordered by rank, then day
+    org_series: dict[int, list[dict]] = {}
+    for org_id, day, cum_true, cum_decided in rows:
+        org_series.setdefault(org_id, []).append(
+            {
+                "date": day.isoformat(),
+                "truthIndex": round(cum_true / cum_decided, 4),
+                "cumulativeTrue": cum_true,
+                "cumulativeDecided": cum_decided,
+            }
         )
-        .order_by(PropositionDB.verify_at)
-        .all()
-    )
-
-    # group by org
-    org_props: dict[int, list] = defaultdict(list)
-    for prop, org_id in all_props:
-        org_props[org_id].append(prop)
 
-    results: list[OrgRunningAverage] = []
-    for org_id in top_org_ids:
-        org = db.get(OrganizationDB, org_id)
-        props = org_props.get(org_id, [])
-        if not props:
-            continue
+    orgs = await _fetch_many(db, OrganizationDB, org_series)
+    results = [
+        {
+            "organization": _org_to_schema(orgs[org_id]),
+            "currentTruthIndex": series[-1]["truthIndex"],
+            "series": series,
+        }
+        for org_id, series in org_series.items()
+    ]
+    return {"topN": top_n, "organizations": results}
 
-        cum_true = 0
-        cum_decided = 0
-        series: list[RunningAvgPoint] = []
-
-        # aggregate by calendar date, emit one point per day with activity
-        day_buckets: dict[str, dict] = {}
-        for p in props:
-            day = p.verify_at.strftime("%Y-%m-%d")
-            if day not in day_buckets:
-                day_buckets[day] = {"true": 0, "decided": 0}
-            day_buckets[day]["decided"] += 1
-            if p.verdict == "true":
-                day_buckets[day]["true"] += 1
-
-        for day in sorted(day_buckets):
-            cum_true += day_buckets[day]["true"]
-            cum_decided += day_buckets[day]["decided"]
-            series.append(
-                RunningAvgPoint(
-                    date=day,
-                    truthIndex=round(cum_true / cum_decided, 4),
-                    cumulativeTrue=cum_true,
-                    cumulativeDecided=cum_decided,
-                )
-            )
 
-        results.append(
-            OrgRunningAverage(
-                organization=_org_to_schema(org),
-                currentTruthIndex=series[-1].truthIndex,
-                series=series,
-            )
-        )
+if __name__ == "__main__":
+    import uvicorn
 
-    # maintain the ranking order
-    rank = {oid: i for i, oid in enumerate(top_org_ids)}
-    results.sort(key=lambda r: rank[r.organization.id])
-    return TopOrgsRunningAvgResponse(topN=top_n, organizations=results)
+    # uvloop + httptools: faster event loop and HTTP parser than the pure-Python
+    # defaults. Workers apply the startup schema setup one at a time.
+    uvicorn.run(
+        "main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        loop="uvloop",
+        http="httptools",
+    )
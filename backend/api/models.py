@@ -5,7 +5,7 @@ from database import Base
 class OrganizationDB(Base):
     __tablename__ = "organizations"
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True)
     url = Column(String, nullable=False)
     logo_url = Column(String, nullable=True)
 
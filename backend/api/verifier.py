@@ -1,39 +1,181 @@
 """LLM-powered proposition verifier using Groq with web search."""
 
 import os
-import json
+import logging
 import time
 import random
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from typing import TypedDict
 
-from groq import Groq
+import httpx
+import orjson
+from groq import AsyncGroq
 from groq.types.chat import ChatCompletionToolParam
 from ddgs import DDGS
 
 
+logger = logging.getLogger(__name__)
+
+
 class VerificationResult(TypedDict):
     verdict: str  # "true", "false", or "future"
     reasoning: str
 
 
-def _groq_retry(fn, *, max_retries=5, initial_delay=0.8, op_name="groq_call"):
-    """Run a Groq call with bounded retries, backoff, and jitter."""
+# httpx.AsyncClient connections belong to the loop that opened them, and the
+# API's request loop and the background verifier's loop are different loops.
+_groq_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _groq_client() -> AsyncGroq:
+    """Groq client for the running event loop; its pooled HTTP connections are
+    reused across verifications instead of a fresh TLS handshake per proposition.
+
+    Created on first use so GROQ_API_KEY can come from a later load_dotenv().
+    """
+    loop = asyncio.get_running_loop()
+    client = _groq_clients.get(loop)
+    if client is None:
+        client = _groq_clients[loop] = AsyncGroq(
+            api_key=os.getenv("GROQ_API_KEY"),
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            ),
+        )
+    return client
+
+
+class GroqLimiter:
+    """Caps in-flight Groq requests and keeps a sliding 60 s request budget.
+
+    Pacing under the RPM limit up front avoids bursts of 429s that the retry
+    backoff would otherwise absorb. The budget is process-wide; the
+    concurrency cap applies per event loop, since asyncio primitives can't be
+    shared between loops.
+    """
+
+    WINDOW = 60.0  # seconds
+
+    def __init__(self, max_concurrency: int, rpm: int):
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self._sent: deque[float] = deque()
+        self._sent_lock = threading.Lock()
+        self._sems = weakref.WeakKeyDictionary()  # event loop -> Semaphore
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._sems.get(loop)
+        if sem is None:
+            sem = self._sems[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    def _reserve(self) -> float:
+        """Claim a slot in the window, or return how long to wait for one."""
+        with self._sent_lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= self.WINDOW:
+                self._sent.popleft()
+            if len(self._sent) < self.rpm:
+                self._sent.append(now)
+                return 0.0
+            return self.WINDOW - (now - self._sent[0])
+
+    async def __aenter__(self):
+        sem = self._semaphore()
+        await sem.acquire()
+        try:
+            while (wait := self._reserve()) > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore().release()
+
+
+_limiter = GroqLimiter(
+    max_concurrency=int(os.getenv("GROQ_MAX_CONCURRENCY", "8")),
+    rpm=int(os.getenv("GROQ_RPM", "30")),
+)
+
+
+async def _groq_retry(fn, *, max_retries=5, initial_delay=0.8, op_name="groq_call"):
+    """Await a Groq call with bounded retries, backoff, and jitter.
+
+    Every attempt, retries included, goes through the shared GroqLimiter.
+    """
     delay = initial_delay
     for attempt in range(max_retries):
         try:
-            return fn()
+            async with _limiter:
+                return await fn()
         except Exception as e:
             if attempt == max_retries - 1:
                 raise
-            print(f"{op_name}: {type(e).__name__}; retrying ({attempt + 1}/{max_retries})")
-            time.sleep(delay + random.uniform(0.0, 0.25))
+            logger.warning(
+                f"{op_name}: {type(e).__name__}; retrying ({attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay + random.uniform(0.0, 0.25))
             delay = min(delay * 2, 8.0)
     raise RuntimeError(f"{op_name}: exhausted retries")
 
 
-def _web_search(query: str, max_results: int = 5) -> str:
-    """Run a web search and return formatted results."""
+SERPER_URL = "https://google.serper.dev/search"
+
+# event loop -> httpx.AsyncClient, per loop for the same reason as _groq_clients
+_search_clients = weakref.WeakKeyDictionary()
+
+
+def _search_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _search_clients.get(loop)
+    if client is None:
+        client = _search_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(20.0, connect=5.0)
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Close the running loop's Groq and search clients.
+
+    Call this at the end of a short-lived loop (one asyncio.run), so its
+    pooled connections are shut down rather than leaked with the loop.
+    """
+    loop = asyncio.get_running_loop()
+    groq_client = _groq_clients.pop(loop, None)
+    if groq_client is not None:
+        await groq_client.close()
+    search_client = _search_clients.pop(loop, None)
+    if search_client is not None:
+        await search_client.aclose()
+
+
+async def _serper_search(query: str, max_results: int, api_key: str) -> str:
+    """Search via Serper's JSON API over the pooled async client."""
+    resp = await _search_client().post(
+        SERPER_URL,
+        json={"q": query, "num": max_results},
+        headers={"X-API-KEY": api_key},
+    )
+    resp.raise_for_status()
+    organic = resp.json().get("organic", [])[:max_results]
+    if not organic:
+        return "(no results)"
+    return "\n".join(f"- {r.get('title', '')}: {r.get('snippet', '')}" for r in organic)
+
+
+def _web_search_sync(query: str, max_results: int) -> str:
     with DDGS() as ddgs:
         results = list(ddgs.text(query, max_results=max_results))
     if not results:
@@ -41,6 +183,41 @@ def _web_search(query: str, max_results: int = 5) -> str:
     return "\n".join(f"- {r['title']}: {r['body']}" for r in results)
 
 
+SEARCH_CACHE_TTL = 600  # seconds
+SEARCH_CACHE_SIZE = 1024
+# (query, max_results) -> (fetched_at, formatted results), least recently
+# used first. The model often re-asks the same query across rounds and across
+# propositions. The API's loop and the verifier thread's loop share it, hence
+# the lock.
+_search_cache: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+async def _web_search(query: str, max_results: int = 5) -> str:
+    """Run a web search and return formatted results.
+
+    Uses Serper when SERPER_API_KEY is set, otherwise DuckDuckGo.
+    """
+    key = (query, max_results)
+    with _search_cache_lock:
+        hit = _search_cache.get(key)
+        if hit and time.monotonic() - hit[0] < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(key)
+            return hit[1]
+    api_key = os.getenv("SERPER_API_KEY")
+    if api_key:
+        result = await _serper_search(query, max_results, api_key)
+    else:
+        # DDGS is a blocking client; keep it off the event loop
+        result = await asyncio.to_thread(_web_search_sync, query, max_results)
+    with _search_cache_lock:
+        _search_cache[key] = (time.monotonic(), result)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return result
+
+
 _SEARCH_TOOL: ChatCompletionToolParam = {
     "type": "function",
     "function": {
@@ -77,32 +254,142 @@ yet occurred and cannot be verified with current information.
 """
 
 
-def verify_proposition(
+_MODEL = "llama-3.3-70b-versatile"
+
+# Max propositions whose verdicts are extracted in one bulk completion
+VERDICT_BATCH_SIZE = 8
+
+
+# Research rounds, the last of which is forced to answer without tools
+RESEARCH_ROUNDS = 8
+# Round budget for claims the triage pass rates as simple (two search rounds)
+SIMPLE_RESEARCH_ROUNDS = 3
+# Tool rounds whose search results stay verbatim in the transcript; older
+# ones are cut to TOOL_SUMMARY_CHARS, since the whole transcript is re-sent
+# on every round
+TOOL_ROUNDS_KEPT = 2
+TOOL_SUMMARY_CHARS = 500
+
+# Small, fast model for the triage pass ahead of research
+_TRIAGE_MODEL = "llama-3.1-8b-instant"
+_TRIAGE_PROMPT = """\
+Classify the corporate statement below before it is fact-checked. Respond with \
+JSON with exactly three boolean fields:
+- "is_future": the statement is about plans, forecasts or events that cannot \
+be checked yet as of the current date
+- "needs_search": checking it needs web evidence (false only if it is plainly \
+unverifiable or self-evidently a forecast)
+- "complex": it combines several figures or facts, or is likely to need many \
+searches
+
+"""
+
+_VERDICT_FORMAT = (
+    'JSON with exactly two fields: "verdict" (one of "true", "false", "future") '
+    'and "reasoning" (a brief explanation).'
+)
+_VERDICT_REQUEST = {
+    "role": "user",
+    "content": "Based on your research, provide your final verdict as "
+    + _VERDICT_FORMAT,
+}
+
+
+def _parse_verdict(parsed: dict) -> VerificationResult:
+    verdict = str(parsed.get("verdict", "future")).lower()
+    if verdict not in ("true", "false", "future"):
+        verdict = "future"
+    return VerificationResult(verdict=verdict, reasoning=parsed.get("reasoning", ""))
+
+
+def _verdict_from_reply(content: str | None) -> VerificationResult | None:
+    """The verdict in a closing research reply, if the model answered in JSON."""
+    content = content or ""
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        parsed = orjson.loads(content[start : end + 1])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(parsed, dict) or "verdict" not in parsed:
+        return None
+    return _parse_verdict(parsed)
+
+
+async def _triage(
+    client: AsyncGroq, claim: str
+) -> tuple[VerificationResult | None, int]:
+    """Cheap first pass deciding how much research a claim gets.
+
+    Returns a verdict for claims that can't be checked yet (skipping research
+    entirely), otherwise the round budget. Falls back to the full budget if
+    the triage call fails.
+    """
+    try:
+        resp = await _groq_retry(
+            lambda: client.chat.completions.create(
+                model=_TRIAGE_MODEL,
+                messages=[{"role": "user", "content": _TRIAGE_PROMPT + claim}],
+                temperature=0,
+                response_format={"type": "json_object"},
+            ),
+            max_retries=2,
+            op_name="verify_triage",
+        )
+        triage = orjson.loads(resp.choices[0].message.content or "")
+    except Exception as e:
+        logger.warning(f"Triage failed ({type(e).__name__}); doing full research")
+        return None, RESEARCH_ROUNDS
+    if not isinstance(triage, dict):
+        return None, RESEARCH_ROUNDS
+
+    if triage.get("is_future") is True:
+        return (
+            VerificationResult(
+                verdict="future",
+                reasoning="Refers to plans or events that cannot be checked yet.",
+            ),
+            0,
+        )
+    if triage.get("needs_search") is False:
+        return None, 1  # answer straight away, no tool rounds
+    if triage.get("complex") is False:
+        return None, SIMPLE_RESEARCH_ROUNDS
+    return None, RESEARCH_ROUNDS
+
+
+async def _research(
+    client: AsyncGroq,
     statement: str,
     speaker_name: str,
     speaker_org: str,
     video_title: str,
     date_stated: datetime,
     verify_at: datetime,
-) -> VerificationResult:
-    """
-    Verify a single proposition using multi-turn Groq chat with web search.
+) -> tuple[list, VerificationResult | None]:
+    """Run the tool-use research phase.
 
-    Returns a VerificationResult with verdict and reasoning.
+    Returns the chat transcript and, when the model closed its research with a
+    JSON answer, the verdict. The last round offers no tools and requests JSON,
+    so a separate verdict call is only needed if the model stopped earlier
+    with free text. The round budget comes from _triage.
     """
-    client = Groq(api_key=os.getenv("GROQ_API_KEY"))
     now = datetime.now(timezone.utc)
 
-    user_prompt = (
-        f"Please verify the following statement:\n\n"
+    claim = (
         f'Statement: "{statement}"\n'
         f"Speaker: {speaker_name} ({speaker_org})\n"
         f"Video: {video_title}\n"
         f"Date stated: {date_stated.strftime('%Y-%m-%d')}\n"
         f"Verify by: {verify_at.strftime('%Y-%m-%d')}\n"
-        f"Current date: {now.strftime('%Y-%m-%d')}\n\n"
+        f"Current date: {now.strftime('%Y-%m-%d')}\n"
+    )
+    user_prompt = (
+        f"Please verify the following statement:\n\n{claim}\n"
         f"Search for evidence and determine if this statement is true, false, "
-        f"or can only be verified in the future."
+        f"or can only be verified in the future. When you are done searching, "
+        f"reply with your final verdict as {_VERDICT_FORMAT}"
     )
 
     messages: list[dict] = [  # type: ignore[type-arg]
@@ -110,14 +397,25 @@ def verify_proposition(
         {"role": "user", "content": user_prompt},
     ]
 
-    # Multi-turn research phase (up to 8 rounds of tool use)
-    for _ in range(8):
-        resp = _groq_retry(
+    verdict, rounds = await _triage(client, claim)
+    if verdict is not None:
+        return messages, verdict
+
+    # Per tool round: (tool message, query) for each search it ran
+    tool_rounds: list[list[tuple[dict, str]]] = []
+    for round_no in range(rounds):
+        if round_no == rounds - 1:
+            # Out of rounds: no tools, answer in JSON now
+            messages.append(_VERDICT_REQUEST)
+            options = {"response_format": {"type": "json_object"}}
+        else:
+            options = {"tools": [_SEARCH_TOOL]}
+        resp = await _groq_retry(
             lambda: client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
+                model=_MODEL,
                 messages=messages,  # type: ignore[arg-type]
-                tools=[_SEARCH_TOOL],
                 temperature=0,
+                **options,
             ),
             op_name="verify_research",
         )
@@ -125,37 +423,44 @@ def verify_proposition(
 
         if msg.tool_calls:
             messages.append(msg)  # type: ignore[arg-type]
-            for tc in msg.tool_calls:
-                if tc.function.name == "web_search":
-                    args = json.loads(tc.function.arguments)
-                    print(f"  [verifier] Searching: {args['query']}")
-                    result = _web_search(args["query"])
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tc.id,
-                            "content": result,
-                        }
-                    )
+            # Run all of this turn's searches at once; replies keep call order
+            calls = [tc for tc in msg.tool_calls if tc.function.name == "web_search"]
+            queries = [orjson.loads(tc.function.arguments)["query"] for tc in calls]
+            for query in queries:
+                logger.info(f"Searching: {query}")
+            results = await asyncio.gather(
+                *(_web_search(q) for q in queries), return_exceptions=True
+            )
+            tool_round = []
+            for tc, query, result in zip(calls, queries, results):
+                if isinstance(result, Exception):
+                    result = f"(search failed: {type(result).__name__})"
+                tool_msg = {
+                    "role": "tool",
+                    "tool_call_id": tc.id,
+                    "content": result,
+                }
+                messages.append(tool_msg)
+                tool_round.append((tool_msg, query))
+            tool_rounds.append(tool_round)
+            if len(tool_rounds) > TOOL_ROUNDS_KEPT:
+                for tool_msg, query in tool_rounds[-TOOL_ROUNDS_KEPT - 1]:
+                    summary = f"[earlier results for {query!r}] {tool_msg['content']}"
+                    tool_msg["content"] = summary[:TOOL_SUMMARY_CHARS]
         else:
             messages.append(msg)  # type: ignore[arg-type]
-            break
+            return messages, _verdict_from_reply(msg.content)
 
-    # Structured output phase — extract verdict
-    messages.append(
-        {
-            "role": "user",
-            "content": (
-                "Based on your research, provide your final verdict as JSON with "
-                'exactly two fields: "verdict" (one of "true", "false", "future") '
-                'and "reasoning" (a brief explanation).'
-            ),
-        }
-    )
+    return messages, None
+
+
+async def _final_verdict(client: AsyncGroq, messages: list) -> VerificationResult:
+    """Structured output phase: extract the verdict from one transcript."""
+    messages.append(_VERDICT_REQUEST)
 
-    final_resp = _groq_retry(
+    final_resp = await _groq_retry(
         lambda: client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+            model=_MODEL,
             messages=messages,  # type: ignore[arg-type]
             temperature=0,
             response_format={"type": "json_object"},
@@ -165,23 +470,279 @@ def verify_proposition(
 
     raw = final_resp.choices[0].message.content or ""
     try:
-        parsed = json.loads(raw)
-        verdict = parsed.get("verdict", "future").lower()
-        if verdict not in ("true", "false", "future"):
-            verdict = "future"
-        reasoning = parsed.get("reasoning", "")
-    except json.JSONDecodeError:
-        verdict = "future"
-        reasoning = f"Failed to parse LLM response: {raw[:500]}"
+        return _parse_verdict(orjson.loads(raw))
+    except orjson.JSONDecodeError:
+        return VerificationResult(
+            verdict="future", reasoning=f"Failed to parse LLM response: {raw[:500]}"
+        )
 
-    return VerificationResult(verdict=verdict, reasoning=reasoning)
+
+async def verify_proposition(
+    statement: str,
+    speaker_name: str,
+    speaker_org: str,
+    video_title: str,
+    date_stated: datetime,
+    verify_at: datetime,
+    client: AsyncGroq | None = None,
+) -> VerificationResult:
+    """
+    Verify a single proposition using multi-turn Groq chat with web search.
+
+    `client` defaults to the shared pooled client for the running loop.
+    Returns a VerificationResult with verdict and reasoning.
+    """
+    client = client or _groq_client()
+    messages, verdict = await _research(
+        client,
+        statement,
+        speaker_name,
+        speaker_org,
+        video_title,
+        date_stated,
+        verify_at,
+    )
+    return verdict or await _final_verdict(client, messages)
+
+
+def _research_notes(messages: list, limit: int = 4000) -> str:
+    """The model's closing research message, or the raw search results if the
+    research rounds ran out before it concluded."""
+    last = messages[-1]
+    if not isinstance(last, dict) and last.content:
+        return last.content[:limit]
+    tool_results = [
+        m["content"] for m in messages if isinstance(m, dict) and m["role"] == "tool"
+    ]
+    return "\n".join(tool_results)[:limit] or "(no evidence gathered)"
+
+
+async def _bulk_verdicts(
+    client: AsyncGroq, items: list[dict], transcripts: list[list]
+) -> list[VerificationResult]:
+    """Extract verdicts for several researched propositions in one completion.
+
+    Items the model leaves out of its answer fall back to a per-item verdict call.
+    """
+    blocks = [
+        f"Item {i}:\n"
+        f'Statement: "{item["statement"]}"\n'
+        f"Speaker: {item['speaker_name']} ({item['speaker_org']})\n"
+        f"Date stated: {item['date_stated'].strftime('%Y-%m-%d')}\n"
+        f"Verify by: {item['verify_at'].strftime('%Y-%m-%d')}\n"
+        f"Research notes:\n{_research_notes(messages)}"
+        for i, (item, messages) in enumerate(zip(items, transcripts))
+    ]
+    prompt = (
+        "Give a final verdict for each researched statement below. Respond with "
+        'JSON of the form {"verdicts": [{"index": <item number>, "verdict": '
+        '"true" | "false" | "future", "reasoning": <brief explanation>}]}, one '
+        "entry per item.\n\n" + "\n\n".join(blocks)
+    )
+    resp = await _groq_retry(
+        lambda: client.chat.completions.create(
+            model=_MODEL,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0,
+            response_format={"type": "json_object"},
+        ),
+        op_name="verify_verdict_bulk",
+    )
+    raw = resp.choices[0].message.content or ""
+    by_index: dict[int, VerificationResult] = {}
+    try:
+        for entry in orjson.loads(raw).get("verdicts", []):
+            if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                by_index[entry["index"]] = _parse_verdict(entry)
+    except (orjson.JSONDecodeError, AttributeError):
+        pass
+
+    missing = [i for i in range(len(items)) if i not in by_index]
+    fallback = await asyncio.gather(
+        *(_final_verdict(client, transcripts[i]) for i in missing)
+    )
+    by_index.update(zip(missing, fallback))
+    return [by_index[i] for i in range(len(items))]
+
+
+async def _research_all(client: AsyncGroq, items: list[dict]):
+    """Research every item concurrently.
+
+    Returns per-item results (the verdict, an exception, or None while still
+    undecided) and the transcripts of the undecided items by index.
+    """
+    researched = await asyncio.gather(
+        *(_research(client, **item) for item in items), return_exceptions=True
+    )
+    results: list = []
+    transcripts: dict[int, list] = {}
+    for i, r in enumerate(researched):
+        if isinstance(r, Exception):
+            results.append(r)
+        else:
+            messages, verdict = r
+            results.append(verdict)
+            if verdict is None:
+                transcripts[i] = messages
+    return results, transcripts
+
+
+async def _live_verdicts(
+    client: AsyncGroq, items: list[dict], results: list, transcripts: dict[int, list]
+) -> None:
+    """Fill in results for the undecided items, VERDICT_BATCH_SIZE per request."""
+    pending = list(transcripts)
+    chunks = [
+        pending[n : n + VERDICT_BATCH_SIZE]
+        for n in range(0, len(pending), VERDICT_BATCH_SIZE)
+    ]
+    verdicts = await asyncio.gather(
+        *(
+            _bulk_verdicts(client, [items[i] for i in c], [transcripts[i] for i in c])
+            for c in chunks
+        ),
+        return_exceptions=True,
+    )
+    for chunk, chunk_verdicts in zip(chunks, verdicts):
+        for n, i in enumerate(chunk):
+            results[i] = (
+                chunk_verdicts
+                if isinstance(chunk_verdicts, Exception)
+                else chunk_verdicts[n]
+            )
+
+
+async def verify_propositions_bulk(
+    items: list[dict], client: AsyncGroq | None = None
+) -> list:
+    """Verify many propositions: research concurrently, then extract the
+    verdicts research didn't already settle VERDICT_BATCH_SIZE at a time, so
+    the batch shares one request per chunk.
+
+    `items` are verify_proposition keyword arguments. Results come back in
+    item order; a proposition whose verification failed gets its exception.
+    """
+    client = client or _groq_client()
+    results, transcripts = await _research_all(client, items)
+    await _live_verdicts(client, items, results, transcripts)
+    return results
+
+
+BATCH_POLL_INTERVAL = 30.0  # seconds, doubled up to BATCH_POLL_MAX
+BATCH_POLL_MAX = 300.0
+
+
+def _message_dict(m) -> dict:
+    return m if isinstance(m, dict) else m.model_dump(exclude_none=True)
+
+
+async def _batch_api_verdicts(
+    client: AsyncGroq, transcripts: dict[int, list], deadline: float
+) -> dict[int, VerificationResult]:
+    """Run the verdict requests through Groq's batch API.
+
+    Returns whatever verdicts are available by `deadline` (a time.monotonic()
+    value); an unfinished batch is cancelled.
+    """
+    lines = [
+        orjson.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": _MODEL,
+                    "messages": [_message_dict(m) for m in messages]
+                    + [_VERDICT_REQUEST],
+                    "temperature": 0,
+                    "response_format": {"type": "json_object"},
+                },
+            }
+        )
+        for i, messages in transcripts.items()
+    ]
+    upload = await client.files.create(
+        file=("verdicts.jsonl", b"\n".join(lines)), purpose="batch"
+    )
+    batch = await client.batches.create(
+        completion_window="24h",
+        endpoint="/v1/chat/completions",
+        input_file_id=upload.id,
+    )
+
+    interval = BATCH_POLL_INTERVAL
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"Batch {batch.id} not done by the deadline; cancelling")
+            await client.batches.cancel(batch.id)
+            return {}
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, BATCH_POLL_MAX)
+        batch = await client.batches.retrieve(batch.id)
+
+    if not batch.output_file_id:
+        logger.warning(f"Batch {batch.id} ended as {batch.status} with no output")
+        return {}
+    output = await client.files.content(batch.output_file_id)
+    verdicts: dict[int, VerificationResult] = {}
+    for line in (await output.text()).splitlines():
+        try:
+            record = orjson.loads(line)
+            body = record["response"]["body"]
+            raw = body["choices"][0]["message"]["content"] or ""
+            verdicts[int(record["custom_id"])] = _parse_verdict(orjson.loads(raw))
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+    return verdicts
+
+
+async def verify_propositions_batch_api(
+    items: list[dict], deadline_s: float, client: AsyncGroq | None = None
+) -> list:
+    """verify_propositions_bulk for non-interactive backlogs: the verdicts
+    research didn't settle go through Groq's discounted batch API instead of
+    live requests.
+
+    The batch API has no tool use, so research still runs live. Verdicts the
+    batch hasn't produced within `deadline_s` seconds (or on any batch API
+    error) fall back to the live bulk path.
+    """
+    client = client or _groq_client()
+    deadline = time.monotonic() + deadline_s
+    results, transcripts = await _research_all(client, items)
+    if not transcripts:
+        return results
+    try:
+        verdicts = await _batch_api_verdicts(client, transcripts, deadline)
+    except Exception:
+        logger.exception("Groq batch API failed; using live verdict requests")
+        verdicts = {}
+    for i, verdict in verdicts.items():
+        results[i] = verdict
+        del transcripts[i]
+    await _live_verdicts(client, items, results, transcripts)
+    return results
 
 
 if __name__ == "__main__":
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
     from dotenv import load_dotenv
 
     load_dotenv()
 
+    # Records are queued by the verifying coroutines and written to stderr by
+    # the listener thread, so log I/O never blocks the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    log_listener = QueueListener(log_queue, logging.StreamHandler())
+    log_listener.start()
+
     test_cases = [
         {
             "statement": "Apple reported over $380 billion in revenue for fiscal year 2023.",
@@ -213,14 +774,21 @@ if __name__ == "__main__":
     print("Verifier stability test")
     print("=" * 60)
 
-    for i, tc in enumerate(test_cases, 1):
-        print(f"\n--- Test {i}: {tc['statement'][:60]}...")
+    async def run_test_cases():
         try:
-            result = verify_proposition(**tc)
+            return await verify_propositions_bulk(test_cases)
+        finally:
+            await close_clients()
+
+    results = asyncio.run(run_test_cases())
+    for i, (tc, result) in enumerate(zip(test_cases, results), 1):
+        print(f"\n--- Test {i}: {tc['statement'][:60]}...")
+        if isinstance(result, Exception):
+            print(f"  ERROR: {type(result).__name__}: {result}")
+        else:
             print(f"  Verdict:   {result['verdict']}")
             print(f"  Reasoning: {result['reasoning'][:200]}")
-        except Exception as e:
-            print(f"  ERROR: {type(e).__name__}: {e}")
 
+    log_listener.stop()
     print("\n" + "=" * 60)
     print("Done")
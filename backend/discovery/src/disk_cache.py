@@ -0,0 +1,37 @@
+"""JSON-file caches under out/cache, one file per key."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+CACHE_ROOT = "out/cache"
+
+
+def cache_path(namespace: str, key: str) -> str:
+    """File for key in namespace; the key is hashed, so any string works."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_ROOT, namespace, f"{digest}.json")
+
+
+def read(path: str, ttl: float | None = None):
+    """Cached value at path, or None if missing, unreadable or older than ttl."""
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write(path: str, value) -> None:
+    """Write atomically, so a concurrent reader or a crash never sees half a file."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+    ) as f:
+        json.dump(value, f, ensure_ascii=False)
+    os.replace(f.name, path)
@@ -4,23 +4,37 @@ Usage:
     python downloader.py [path/to/sp500_youtube_videos_groq.json]
 
 Videos are saved to  out/media/<SYMBOL>/<video_id>.mp4
-Supports graceful Ctrl+C (finishes current download, then stops) and
-automatic resume (skips videos that already exist on disk).
+Downloads run DL_CONCURRENCY at a time (default 4). Supports graceful Ctrl+C
+(finishes in-flight downloads, then stops) and automatic resume (skips videos
+that already exist on disk).
 """
 
+import asyncio
 import json
 import os
 import signal
 import sys
+from collections import defaultdict
 
 import yt_dlp
 
+try:
+    import ijson  # optional: stream the input instead of loading it whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster whole-file parse when ijson is missing
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
 DEFAULT_INPUT = "out/sp500_youtube_videos_groq.json"
 MEDIA_ROOT = "out/media"
+DL_CONCURRENCY = int(os.getenv("DL_CONCURRENCY", "4"))
 
 # ---------------------------------------------------------------------------
 # Graceful shutdown
@@ -33,9 +47,10 @@ def _signal_handler(sig, frame):
     global _stop_requested
     if _stop_requested:
         print("\nForce quit.")
-        sys.exit(1)
+        # sys.exit would wait for the in-flight download threads to finish
+        os._exit(1)
     _stop_requested = True
-    print("\nStop requested — will exit after the current download finishes.")
+    print("\nStop requested — will exit after the in-flight downloads finish.")
     print("Press Ctrl+C again to force quit.")
 
 
@@ -74,6 +89,72 @@ def download_video(video_id: str, out_dir: str) -> bool:
         return False
 
 
+def _existing_downloads() -> defaultdict[str, set[str]]:
+    """video_ids already on disk, per symbol: one scandir per symbol directory
+    instead of a stat per task."""
+    existing: defaultdict[str, set[str]] = defaultdict(set)
+    if not os.path.isdir(MEDIA_ROOT):
+        return existing
+    with os.scandir(MEDIA_ROOT) as sym_dirs:
+        for sym_dir in sym_dirs:
+            if not sym_dir.is_dir():
+                continue
+            with os.scandir(sym_dir.path) as entries:
+                existing[sym_dir.name] = {
+                    e.name.removesuffix(".mp4")
+                    for e in entries
+                    if e.name.endswith(".mp4")
+                }
+    return existing
+
+
+async def _download_all(tasks: list[tuple[str, str, str]]) -> dict[str, int]:
+    """Download tasks in worker threads, DL_CONCURRENCY at a time.
+
+    yt-dlp waits on the network and ffmpeg muxes in a subprocess, so threads
+    overlap well. Each worker checks the stop flag before taking its next
+    task, so no new download starts once a stop is requested.
+    """
+    counts = {"downloaded": 0, "failed": 0}
+    queue: asyncio.Queue[tuple[int, str, str, str]] = asyncio.Queue()
+    for i, task in enumerate(tasks, 1):
+        queue.put_nowait((i, *task))
+
+    async def worker():
+        while not _stop_requested and not queue.empty():
+            i, symbol, video_id, title = queue.get_nowait()
+            out_dir = os.path.join(MEDIA_ROOT, symbol)
+            out_path = os.path.join(out_dir, f"{video_id}.mp4")
+            short_title = title[:60] + "..." if len(title) > 60 else title
+            print(f"[{i}/{len(tasks)}] {symbol} | {short_title}")
+
+            if await asyncio.to_thread(download_video, video_id, out_dir):
+                counts["downloaded"] += 1
+                print(f"         -> saved to {out_path}")
+            else:
+                counts["failed"] += 1
+
+    await asyncio.gather(*(worker() for _ in range(DL_CONCURRENCY)))
+    if _stop_requested:
+        print("\nStopped before starting the remaining downloads.")
+    return counts
+
+
+def _iter_companies(input_file: str):
+    """Yield company entries from the discovery output.
+
+    With ijson installed the file is parsed incrementally, so only one company
+    is held in memory at a time; otherwise it is loaded in one go.
+    """
+    if ijson is not None:
+        with open(input_file, "rb") as f:
+            yield from ijson.items(f, "item")
+        return
+    with open(input_file, "rb") as f:
+        data = f.read()
+    yield from (orjson.loads(data) if orjson is not None else json.loads(data))
+
+
 def main():
     input_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INPUT
 
@@ -81,12 +162,11 @@ def main():
         print(f"Error: {input_file} not found")
         sys.exit(1)
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        companies = json.load(f)
-
     # Collect all (symbol, video_id) pairs
     tasks: list[tuple[str, str, str]] = []  # (symbol, video_id, title)
-    for company in companies:
+    n_companies = 0
+    for company in _iter_companies(input_file):
+        n_companies += 1
         symbol = company["symbol"]
         for event in company.get("events", []):
             for video in event.get("videos", []):
@@ -98,54 +178,39 @@ def main():
         print("No videos to download.")
         return
 
-    # Count how many are already downloaded
-    already = sum(
-        1
-        for sym, vid, _ in tasks
-        if os.path.exists(os.path.join(MEDIA_ROOT, sym, f"{vid}.mp4"))
-    )
-
-    print(f"Found {len(tasks)} videos across {len(companies)} companies")
+    # Drop the ones already downloaded, then repeats of the same video (they
+    # would otherwise download the same file concurrently)
+    existing = _existing_downloads()
+    missing = [
+        (sym, vid, title) for sym, vid, title in tasks if vid not in existing[sym]
+    ]
+    already = len(tasks) - len(missing)
+    todo = list({(sym, vid): (sym, vid, title) for sym, vid, title in missing}.values())
+    repeats = len(missing) - len(todo)
+
+    print(f"Found {len(tasks)} videos across {n_companies} companies")
     if already:
-        print(f"  {already} already downloaded, {len(tasks) - already} remaining")
+        print(f"  {already} already downloaded, {len(missing)} remaining")
+    if repeats:
+        print(f"  {repeats} listed more than once; each is downloaded once")
     print(f"Downloading to {MEDIA_ROOT}/<SYMBOL>/<video_id>.mp4")
-    print("(Press Ctrl+C to stop after the current download)\n")
+    print(f"{DL_CONCURRENCY} downloads at a time")
+    print("(Press Ctrl+C to stop after the in-flight downloads)\n")
 
-    # Install signal handler
+    # Install signal handler (asyncio.run keeps a non-default SIGINT handler)
     original_sigint = signal.getsignal(signal.SIGINT)
     signal.signal(signal.SIGINT, _signal_handler)
 
-    downloaded = 0
-    skipped = 0
-    failed = 0
-
-    for i, (symbol, video_id, title) in enumerate(tasks, 1):
-        if _stop_requested:
-            print(f"\nStopping at video {i}/{len(tasks)}.")
-            break
-
-        out_dir = os.path.join(MEDIA_ROOT, symbol)
-        out_path = os.path.join(out_dir, f"{video_id}.mp4")
-
-        if os.path.exists(out_path):
-            skipped += 1
-            continue
-
-        short_title = title[:60] + "..." if len(title) > 60 else title
-        print(f"[{i}/{len(tasks)}] {symbol} | {short_title}")
-
-        ok = download_video(video_id, out_dir)
-        if ok:
-            downloaded += 1
-            print(f"         -> saved to {out_path}")
-        else:
-            failed += 1
+    counts = asyncio.run(_download_all(todo))
 
     # Restore signal handler
     signal.signal(signal.SIGINT, original_sigint)
 
     print(f"\n{'=' * 60}")
-    print(f"Done.  Downloaded: {downloaded}  Skipped: {skipped}  Failed: {failed}")
+    print(
+        f"Done.  Downloaded: {counts['downloaded']}  Skipped: {already}  "
+        f"Failed: {counts['failed']}"
+    )
     if _stop_requested:
         print("Run again to resume.")
 
@@ -1,9 +1,125 @@
 """LLM-based video relevance judge using Groq."""
 
 import json
+import logging
+from typing import Hashable, TypedDict
 from groq import Groq
+import disk_cache
 from youtube_types import VideoInfo
-from prompts import load_prompt
+from prompts import load_prompt, prompt_hash
+
+try:
+    import orjson  # optional: faster encode/decode of the judge payloads
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Read once at import rather than from disk on every judge call
+_SYSTEM_PROMPT = load_prompt("judge_system")
+_USER_PROMPT = load_prompt("judge_user")
+_BATCHES_USER_PROMPT = load_prompt("judge_batches_user")
+_JUDGE_PROMPTS_HASH = prompt_hash("judge_system", "judge_user", "judge_batches_user")
+
+# Titles past this length add tokens but no signal for the judge
+MAX_TITLE_CHARS = 120
+
+# Upper bound on candidate sets per judge_videos_batches request; keeps the
+# prompt and the judgments array well inside the model's limits.
+MAX_BATCHES_PER_CALL = 12
+
+
+class JudgeBatch(TypedDict):
+    key: Hashable
+    videos: list[VideoInfo]
+    event_name: str
+
+
+def _video_entries(videos: list[VideoInfo]) -> list[dict]:
+    """Metadata the judge sees for each candidate video.
+
+    Unknown view counts/durations are left out rather than sent as null.
+    """
+    entries = []
+    for i, v in enumerate(videos):
+        entry = {
+            "index": i,
+            "title": v["title"][:MAX_TITLE_CHARS],
+            "channel": v["channel_title"],
+        }
+        if v.get("view_count") is not None:
+            entry["view_count"] = v["view_count"]
+        if v.get("duration"):
+            entry["duration_minutes"] = round(v["duration"] / 60, 1)
+        entry["channel_is_verified"] = v.get("channel_is_verified", False)
+        entries.append(entry)
+    return entries
+
+
+def _compact_json(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _loads(text: str):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # except clauses hold either way
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _chosen_video(videos: list[VideoInfo], judgment: dict) -> VideoInfo | None:
+    """Apply a judgment to its candidate list; None if nothing was chosen."""
+    chosen = int(judgment.get("chosen_index", -1))
+    if chosen < 0 or chosen >= len(videos):
+        return None
+
+    video = videos[chosen]
+    video["relevance_score"] = float(judgment.get("relevance_score", 0))
+    video["judge_reasoning"] = judgment.get("reasoning", "")
+    return video
+
+
+def _judgment_cache_path(
+    videos: list[VideoInfo], event_name: str, company_name: str
+) -> str:
+    """Cache file for a judgment. The candidate set is keyed order-free, and
+    the prompts are part of the key, so editing them drops old judgments."""
+    video_ids = ",".join(sorted(v["video_id"] for v in videos))
+    key = "|".join(
+        (_JUDGE_PROMPTS_HASH, company_name, event_name.lower().strip(), video_ids)
+    )
+    return disk_cache.cache_path("judge", key)
+
+
+def _cached_judgment(path: str, videos: list[VideoInfo]) -> dict | None:
+    """A stored judgment re-indexed against this ordering of videos."""
+    cached = disk_cache.read(path)
+    if cached is None:
+        return None
+    video_ids = [v["video_id"] for v in videos]
+    chosen_id = cached["chosen_video_id"]
+    return {
+        "chosen_index": video_ids.index(chosen_id) if chosen_id in video_ids else -1,
+        "relevance_score": cached["relevance_score"],
+        "reasoning": cached["reasoning"],
+    }
+
+
+def _store_judgment(path: str, videos: list[VideoInfo], judgment: dict) -> None:
+    # Stored by video_id rather than index, so any ordering of the same
+    # candidates hits
+    chosen = int(judgment.get("chosen_index", -1))
+    disk_cache.write(
+        path,
+        {
+            "chosen_video_id": (
+                videos[chosen]["video_id"] if 0 <= chosen < len(videos) else None
+            ),
+            "relevance_score": judgment.get("relevance_score", 0),
+            "reasoning": judgment.get("reasoning", ""),
+        },
+    )
 
 
 def judge_videos_batch(
@@ -17,32 +133,32 @@ def judge_videos_batch(
 
     Sends titles, channels, and yt-dlp metadata to an LLM which picks at most
     one video that is a genuine, primary-source recording of the event.
-    Returns None when no video in the batch is relevant.
+    Returns None when no video in the batch is relevant. Judgments are cached
+    on disk, so the same candidates for the same event aren't judged twice.
     """
     if not videos:
         return None
 
+    cache_path = _judgment_cache_path(videos, event_name, company_name)
+    judgment = _cached_judgment(cache_path, videos)
+    if judgment is None:
+        judgment = _judge_one(groq_client, videos, event_name, company_name)
+        if judgment is None:
+            return None
+        _store_judgment(cache_path, videos, judgment)
+    return _chosen_video(videos, judgment)
 
-    video_entries = []
-    for i, v in enumerate(videos):
-        duration_sec = v.get("duration")
-        duration_min = round(duration_sec / 60, 1) if duration_sec else None
-
-        video_entries.append(
-            {
-                "index": i,
-                "title": v["title"],
-                "channel": v["channel_title"],
-                "view_count": v.get("view_count"),
-                "duration_minutes": duration_min,
-                "channel_is_verified": v.get("channel_is_verified", False),
-            }
-        )
 
-    video_entries_json = json.dumps(video_entries, indent=2)
+def _judge_one(
+    groq_client: Groq,
+    videos: list[VideoInfo],
+    event_name: str,
+    company_name: str,
+) -> dict | None:
+    """One judge request for one batch; None if the call or parse failed."""
+    video_entries_json = _compact_json(_video_entries(videos))
 
-    system_prompt = load_prompt("judge_system")
-    user_prompt = load_prompt("judge_user").format(
+    user_prompt = _USER_PROMPT.format(
         event_name=event_name,
         company_name=company_name,
         video_entries_json=video_entries_json,
@@ -51,7 +167,7 @@ def judge_videos_batch(
     try:
         resp = groq_client.chat.completions.create(
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
             model="openai/gpt-oss-20b",
@@ -83,22 +199,130 @@ def judge_videos_batch(
             lines = response_text.split("\n")
             response_text = "\n".join(lines[1:-1])
 
-        judgment = json.loads(response_text)
+        judgment = _loads(response_text)
 
     except (json.JSONDecodeError, Exception) as e:
-        print(f"    Judge error: {e}")
+        logger.warning(f"Judge error: {e}")
         return None
 
-    chosen = judgment.get("chosen_index")
+    return judgment
 
-    chosen = int(chosen)
-    if chosen < 0 or chosen >= len(videos):
-        return None
 
-    video = videos[chosen]
-    video["relevance_score"] = float(judgment.get("relevance_score", 0))
-    video["judge_reasoning"] = judgment.get("reasoning", "")
-    return video
+def judge_videos_batches(
+    groq_client: Groq,
+    batches: list[JudgeBatch],
+    company_name: str,
+) -> dict[Hashable, VideoInfo | None]:
+    """
+    Judge many candidate sets (e.g. every event x year for a company) with
+    one request per MAX_BATCHES_PER_CALL sets instead of one per set.
+
+    Returns the best video (or None) for each batch key. Batches with a
+    cached judgment skip the model; ones it leaves out of its answer are
+    judged individually.
+    """
+    results: dict[Hashable, VideoInfo | None] = {}
+    pending: list[tuple[JudgeBatch, str]] = []
+    for batch in batches:
+        if not batch["videos"]:
+            continue
+        path = _judgment_cache_path(batch["videos"], batch["event_name"], company_name)
+        judgment = _cached_judgment(path, batch["videos"])
+        if judgment is None:
+            pending.append((batch, path))
+        else:
+            results[batch["key"]] = _chosen_video(batch["videos"], judgment)
+
+    for start in range(0, len(pending), MAX_BATCHES_PER_CALL):
+        chunk = pending[start : start + MAX_BATCHES_PER_CALL]
+        judgments = _judge_chunk(groq_client, [b for b, _ in chunk], company_name)
+        for batch_id, (batch, path) in enumerate(chunk):
+            judgment = judgments.get(batch_id) or _judge_one(
+                groq_client, batch["videos"], batch["event_name"], company_name
+            )
+            if judgment is None:
+                results[batch["key"]] = None
+                continue
+            _store_judgment(path, batch["videos"], judgment)
+            results[batch["key"]] = _chosen_video(batch["videos"], judgment)
+    return results
+
+
+def _judge_chunk(
+    groq_client: Groq, chunk: list[JudgeBatch], company_name: str
+) -> dict[int, dict]:
+    """One judge request for several batches; judgments keyed by batch_id."""
+    batches_json = _compact_json(
+        [
+            {
+                "batch_id": batch_id,
+                "event_name": batch["event_name"],
+                "videos": _video_entries(batch["videos"]),
+            }
+            for batch_id, batch in enumerate(chunk)
+        ]
+    )
+    user_prompt = _BATCHES_USER_PROMPT.format(
+        company_name=company_name,
+        batches_json=batches_json,
+    )
+
+    try:
+        resp = groq_client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            model="openai/gpt-oss-20b",
+            temperature=0,
+            max_tokens=200 + 300 * len(chunk),
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "yt_res_batches",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "judgments": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "batch_id": {"type": "integer"},
+                                        "chosen_index": {"type": "integer"},
+                                        "relevance_score": {"type": "number"},
+                                        "reasoning": {"type": "string"},
+                                    },
+                                    "required": [
+                                        "batch_id",
+                                        "chosen_index",
+                                        "relevance_score",
+                                        "reasoning",
+                                    ],
+                                    "additionalProperties": False,
+                                },
+                            },
+                        },
+                        "required": ["judgments"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+        )
+
+        response_text = (resp.choices[0].message.content or "").strip()
+        judgments = _loads(response_text)["judgments"]
+
+    except (json.JSONDecodeError, Exception) as e:
+        logger.warning(f"Judge error: {e}")
+        return {}
+
+    return {
+        j["batch_id"]: j
+        for j in judgments
+        if isinstance(j, dict) and 0 <= j.get("batch_id", -1) < len(chunk)
+    }
 
 
 def deduplicate_videos(videos: list[VideoInfo]) -> list[VideoInfo]:
@@ -1,15 +1,30 @@
+import asyncio
 import csv
+import hashlib
 import json
+import logging
 import os
+import queue
 import signal
 import sys
+import threading
+import urllib.parse
+import urllib.request
+from logging.handlers import QueueHandler, QueueListener
+import disk_cache
 from rag import *
-from judge import judge_videos_batch, deduplicate_videos
+from judge import JudgeBatch, deduplicate_videos, judge_videos_batches
+from prompts import prompt_hash
 from dotenv import load_dotenv
 from groq import Groq
 
 import yt_dlp
 
+try:
+    import orjson  # optional: faster encode/decode of the results files
+except ImportError:
+    orjson = None
+
 from youtube_types import (
     CompanyData,
     VideoInfo,
@@ -17,24 +32,32 @@ from youtube_types import (
     CompanyEvent,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Checkpoint helpers
 # ---------------------------------------------------------------------------
 
 CHECKPOINT_FILE = "out/checkpoint.json"
+# Finished companies, one JSON object per line, appended as each completes;
+# main writes the JSON array consumers read once the run ends
+PROGRESS_FILE = "out/sp500_youtube_videos_groq.ndjson"
 
 
-def _save_checkpoint(
-    company_data_list: list[CompanyData],
-    completed_symbols: set[str],
-    output_file: str,
-) -> None:
-    """Write the current results and the set of completed symbols to disk."""
+def _save_checkpoint(company_data: CompanyData, completed_symbols: set[str]) -> None:
+    """Append a finished company to the progress file and record it as done.
+
+    Appending keeps each checkpoint proportional to one company rather than
+    to everything fetched so far.
+    """
     os.makedirs(os.path.dirname(CHECKPOINT_FILE), exist_ok=True)
 
-    # Save the main output (only fully-completed companies)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(company_data_list, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        line = orjson.dumps(company_data) + b"\n"
+    else:
+        line = (json.dumps(company_data, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(PROGRESS_FILE, "ab") as f:
+        f.write(line)
 
     # Save lightweight checkpoint metadata
     with open(CHECKPOINT_FILE, "w", encoding="utf-8") as f:
@@ -45,25 +68,37 @@ def _save_checkpoint(
         )
 
 
-def _load_checkpoint(
-    output_file: str,
-) -> tuple[list[CompanyData], set[str]]:
+def _iter_progress():
+    """Stream companies from the progress file, stopping at a torn last line."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(PROGRESS_FILE, "rb") as f:
+        for line in f:
+            try:
+                yield loads(line)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            except json.JSONDecodeError:
+                return
+
+
+def _load_checkpoint() -> tuple[list[CompanyData], set[str]]:
     """Load previous results and completed symbols.  Returns empty defaults
     if no checkpoint exists."""
     completed: set[str] = set()
     data: list[CompanyData] = []
 
-    if os.path.exists(CHECKPOINT_FILE) and os.path.exists(output_file):
+    if os.path.exists(CHECKPOINT_FILE) and os.path.exists(PROGRESS_FILE):
         try:
             with open(CHECKPOINT_FILE, "r", encoding="utf-8") as f:
                 meta = json.load(f)
             completed = set(meta.get("completed_symbols", []))
 
-            with open(output_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Defensive: only keep entries whose symbol is in completed set
-            data = [d for d in data if d["symbol"] in completed]
+            # Defensive: only keep entries whose symbol is in completed set,
+            # and the latest line if a company was appended twice (a crash
+            # between the append and the metadata write)
+            by_symbol = {
+                d["symbol"]: d for d in _iter_progress() if d["symbol"] in completed
+            }
+            data = list(by_symbol.values())
         except (json.JSONDecodeError, KeyError):
             completed = set()
             data = []
@@ -71,6 +106,22 @@ def _load_checkpoint(
     return data, completed
 
 
+def _clear_checkpoint() -> None:
+    for path in (CHECKPOINT_FILE, PROGRESS_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _write_output(company_data_list: list[CompanyData], output_file: str) -> None:
+    """Write all results as one JSON array (the format downloader.py reads)."""
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(company_data_list, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(company_data_list, f, indent=2, ensure_ascii=False)
+
+
 # Global flag for graceful shutdown
 _stop_requested = False
 
@@ -82,27 +133,94 @@ def _signal_handler(sig, frame):
         print("\nForce quit.")
         sys.exit(1)
     _stop_requested = True
-    print("\nStop requested — will save and exit after current company finishes.")
+    print("\nStop requested — will save and exit after the in-flight companies.")
     print("Press Ctrl+C again to force quit (progress may be lost).")
 
 
+# ---------------------------------------------------------------------------
+# Disk caches
+# ---------------------------------------------------------------------------
+
+SEARCH_CACHE_DIR = "out/cache/search"
+SEARCH_CACHE_TTL = 7 * 86400  # seconds
+# Bump when the cached VideoInfo shape changes; old entries are then ignored
+SEARCH_CACHE_VERSION = 1
+
+
+def _search_cache_path(search_query: str, year: int, max_results: int) -> str:
+    key = f"{SEARCH_CACHE_VERSION}|{search_query}|{year}|{max_results}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(SEARCH_CACHE_DIR, f"{digest}.json")
+
+
+# Events only change with the prompts, which are part of the key, so
+# discovery entries don't expire
+_DISCOVERY_PROMPTS_HASH = prompt_hash("event_discovery_system", "event_discovery_user")
+
+
+def _discovery_cache_path(company_name: str, symbol: str, sector: str) -> str:
+    key = f"{_DISCOVERY_PROMPTS_HASH}|{symbol}|{company_name}|{sector}"
+    return disk_cache.cache_path("discovery", key)
+
+
+def discover_company_events_cached(
+    client: Groq, company_name: str, symbol: str, sector: str
+) -> CompanyEvents:
+    """discover_company_events, cached on disk per company and prompt version.
+
+    Empty results (usually a failed call) are not cached.
+    """
+    cache_path = _discovery_cache_path(company_name, symbol, sector)
+    cached = disk_cache.read(cache_path)
+    if cached is not None:
+        logger.info(f"{symbol}: events from cache")
+        return cached
+
+    result = discover_company_events(client, company_name, symbol, sector)
+    if result["events"]:
+        disk_cache.write(cache_path, result)
+    return result
+
+
+_SEARCH_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "extract_flat": "in_playlist",
+    "skip_download": True,
+}
+
+_thread_local = threading.local()
+
+
+def _search_ydl() -> yt_dlp.YoutubeDL:
+    """This worker thread's search YoutubeDL.
+
+    Building one per search re-runs option parsing and extractor setup and
+    drops its HTTP connections; YoutubeDL isn't thread-safe, so each worker
+    thread keeps its own and reuses it.
+    """
+    ydl = getattr(_thread_local, "search_ydl", None)
+    if ydl is None:
+        ydl = _thread_local.search_ydl = yt_dlp.YoutubeDL(_SEARCH_YDL_OPTS)
+    return ydl
+
+
 def search_videos(
     search_query: str, year: int, max_results: int = 10
 ) -> list[VideoInfo]:
-    """Search YouTube for videos using yt-dlp (no API key required)."""
+    """Search YouTube for videos using yt-dlp (no API key required).
 
-    query = f"ytsearch{max_results}:{search_query} {year}"
+    Results are cached on disk for SEARCH_CACHE_TTL; failed searches are not.
+    """
+    cache_path = _search_cache_path(search_query, year, max_results)
+    cached = disk_cache.read(cache_path, SEARCH_CACHE_TTL)
+    if cached is not None:
+        return cached
 
-    ydl_opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "extract_flat": "in_playlist",
-        "skip_download": True,
-    }
+    query = f"ytsearch{max_results}:{search_query} {year}"
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            result = ydl.extract_info(query, download=False)
+        result = _search_ydl().extract_info(query, download=False)
 
         videos: list[VideoInfo] = []
         for entry in (result or {}).get("entries", []):
@@ -124,13 +242,37 @@ def search_videos(
                 }
             )
 
+        disk_cache.write(cache_path, videos)
         return videos
 
     except Exception as e:
-        print(f"Error searching for '{search_query}' ({year}): {e}")
+        logger.error(f"Error searching for '{search_query}' ({year}): {e}")
         return []
 
 
+# Max yt-dlp lookups in flight at once, across all companies
+YTDLP_CONCURRENCY = 8
+# Companies fetched at once; each mostly waits on Groq and yt-dlp
+COMPANY_CONCURRENCY = int(os.getenv("COMPANY_CONCURRENCY", "4"))
+# Max Groq requests in flight at once, across all companies
+GROQ_CONCURRENCY = int(os.getenv("GROQ_CONCURRENCY", "4"))
+
+# Semaphores bind to the running loop on first use, so these can be shared
+_ytdlp_sem = asyncio.Semaphore(YTDLP_CONCURRENCY)
+_groq_sem = asyncio.Semaphore(GROQ_CONCURRENCY)
+
+
+async def _map_threads(fn, arg_tuples: list[tuple]) -> list:
+    """Run blocking fn over arg_tuples in worker threads, YTDLP_CONCURRENCY at
+    a time. Results are returned in input order."""
+
+    async def run(args):
+        async with _ytdlp_sem:
+            return await asyncio.to_thread(fn, *args)
+
+    return await asyncio.gather(*(run(args) for args in arg_tuples))
+
+
 def fetch_video_upload_date(video_id: str) -> str | None:
     """Fetch the upload date for a single video using yt-dlp (full extraction).
 
@@ -152,73 +294,171 @@ def fetch_video_upload_date(video_id: str) -> str | None:
             return f"{raw[:4]}-{raw[4:6]}-{raw[6:8]}"
         return None
     except Exception as e:
-        print(f"      Warning: could not fetch upload date for {video_id}: {e}")
+        logger.warning(f"Could not fetch upload date for {video_id}: {e}")
         return None
 
 
-def fetch_company_videos(
+YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
+# videos.list accepts at most this many ids per request
+YOUTUBE_IDS_PER_CALL = 50
+
+
+def fetch_upload_dates_api(video_ids: list[str], api_key: str) -> dict[str, str]:
+    """Fetch upload dates via the YouTube Data API, 50 videos per request.
+
+    One videos.list call replaces a full yt-dlp watch-page extraction per
+    video. Returns {video_id: "YYYY-MM-DD"}; ids missing from the response
+    (or from a failed request) are left out.
+    """
+    dates: dict[str, str] = {}
+    for start in range(0, len(video_ids), YOUTUBE_IDS_PER_CALL):
+        chunk = video_ids[start : start + YOUTUBE_IDS_PER_CALL]
+        params = urllib.parse.urlencode(
+            {
+                "part": "snippet",
+                "id": ",".join(chunk),
+                "maxResults": YOUTUBE_IDS_PER_CALL,
+                "key": api_key,
+            }
+        )
+        try:
+            with urllib.request.urlopen(
+                f"{YOUTUBE_VIDEOS_URL}?{params}", timeout=30
+            ) as resp:
+                items = json.load(resp).get("items", [])
+        except Exception as e:
+            logger.warning(f"videos.list failed for {len(chunk)} videos: {e}")
+            continue
+        for item in items:
+            published = item.get("snippet", {}).get("publishedAt")
+            if published:
+                dates[item["id"]] = published[:10]
+    return dates
+
+
+async def fetch_company_videos(
     groq_client: Groq,
     symbol: str,
     company_name: str,
     sector: str,
     years: range,
+    accepted_ids: set[str] | frozenset[str] = frozenset(),
 ) -> CompanyData:
-    """Fetch all videos for a company using Groq-discovered events."""
-    print(f"\nFetching videos for {symbol} - {company_name}")
+    """Fetch all videos for a company using Groq-discovered events.
+
+    Videos in accepted_ids (already chosen for another company) are not sent
+    to the judge again. The Groq and yt-dlp calls are blocking, so they run
+    in worker threads.
+    """
+    # Companies run concurrently, so every line names its company
+    logger.info(f"{symbol}: fetching videos for {company_name}")
 
     # Step 1: Discover events for this company using Groq
-    print("  Discovering company events with Groq...")
-    discovery_result = discover_company_events(
-        groq_client, company_name, symbol, sector
-    )
+    logger.info(f"{symbol}: discovering company events with Groq...")
+    async with _groq_sem:
+        discovery_result = await asyncio.to_thread(
+            discover_company_events_cached, groq_client, company_name, symbol, sector
+        )
     discovered_events = discovery_result["events"]
 
     if not discovered_events:
-        print("  No events discovered, skipping company")
+        logger.info(f"{symbol}: no events discovered, skipping company")
         return CompanyData(symbol=symbol, name=company_name, events=[])
 
-    print(f"  Found {len(discovered_events)} events:")
-    for event in discovered_events:
-        print(f"    - {event['event_name']}")
+    logger.info(
+        f"{symbol}: found {len(discovered_events)} events: "
+        + "; ".join(event["event_name"] for event in discovered_events)
+    )
+
+    # Step 2: Search for videos for each discovered event and year; the
+    # searches are network-bound, so they all run concurrently
+    searches = [
+        (event_idx, event, year)
+        for event_idx, event in enumerate(discovered_events)
+        for year in years
+    ]
+    # Events often share a search query; each (query, year) is searched once
+    # and its results fanned back out to every event that asked for it. Each
+    # event gets its own copies, since the judge annotates the chosen video.
+    queries = list(
+        dict.fromkeys((event["search_query"], year) for _, event, year in searches)
+    )
+    logger.info(
+        f"{symbol}: running {len(queries)} searches ({len(searches)} event/years)..."
+    )
+    results_by_query = dict(zip(queries, await _map_threads(search_videos, queries)))
+    search_results = [
+        [dict(v) for v in results_by_query[(event["search_query"], year)]]
+        for _, event, year in searches
+    ]
+    # Each year's full results go to the judge (a video rejected for one
+    # year may be the right pick for another); repeats among the chosen videos
+    # are dropped afterwards. Videos another company already claimed are
+    # left out.
+    batches: list[JudgeBatch] = []
+    for (event_idx, event, year), raw_videos in zip(searches, search_results):
+        raw_videos = [v for v in raw_videos if v["video_id"] not in accepted_ids]
+        if raw_videos:
+            logger.info(
+                f"{symbol}: {event['search_query']} {year}: {len(raw_videos)} results"
+            )
+            batches.append(
+                {
+                    "key": (event_idx, year),
+                    "videos": raw_videos,
+                    "event_name": f"{event['event_name']} {year}",
+                }
+            )
+
+    # Step 3: Judge relevance for every event/year at once — the single best
+    # video per search, or None
+    logger.info(f"{symbol}: judging {len(batches)} searches...")
+    async with _groq_sem:
+        judged = await asyncio.to_thread(
+            judge_videos_batches, groq_client, batches, company_name=company_name
+        )
 
-    # Step 2: Search for videos for each discovered event, judge, deduplicate
+    # Fetch the actual upload dates for the chosen videos: in batched
+    # videos.list calls when a YouTube API key is set, otherwise one yt-dlp
+    # extraction per video, run concurrently
+    chosen_ids = sorted({v["video_id"] for v in judged.values() if v is not None})
+    youtube_api_key = os.getenv("YOUTUBE_API_KEY")
+    if youtube_api_key:
+        upload_dates = await asyncio.to_thread(
+            fetch_upload_dates_api, chosen_ids, youtube_api_key
+        )
+    else:
+        upload_dates = dict(
+            zip(
+                chosen_ids,
+                await _map_threads(
+                    fetch_video_upload_date, [(vid,) for vid in chosen_ids]
+                ),
+            )
+        )
+
+    # Step 4: Collect, deduplicate and rank per event
     event_videos_list: list[EventVideos] = []
 
-    for event in discovered_events:
+    for event_idx, event in enumerate(discovered_events):
         all_videos: list[VideoInfo] = []
 
-        print(f"\n  Searching for: {event['event_name']}")
-
-        # Search for each year separately
         for year in years:
-            print(f"    {event['search_query']} {year}")
-            raw_videos = search_videos(event["search_query"], year)
-            if raw_videos:
-                print(f"    {year}: {len(raw_videos)} raw results", end="")
-
-                # Judge relevance — returns the single best video or None
-                best = judge_videos_batch(
-                    groq_client,
-                    raw_videos,
-                    event_name=f"{event['event_name']} {year}",
-                    company_name=company_name,
-                )
-                if best is not None:
-                    print(
-                        f" -> kept 1 (score {best.get('relevance_score', '?')})", end=""
-                    )
-                    # Fetch the actual upload date for the chosen video
-                    upload_date = fetch_video_upload_date(best["video_id"])
-                    if upload_date:
-                        best["upload_date"] = upload_date
-                        print(f" [{upload_date}]")
-                    else:
-                        print()
-                    all_videos.append(best)
-                else:
-                    print(" -> none relevant")
-
-        # Deduplicate across all years (same video can appear in multiple searches)
+            if (event_idx, year) not in judged:
+                continue
+            best = judged[(event_idx, year)]
+            if best is not None:
+                kept = f"kept 1 (score {best.get('relevance_score', '?')})"
+                upload_date = upload_dates.get(best["video_id"])
+                if upload_date:
+                    best["upload_date"] = upload_date
+                    kept += f" [{upload_date}]"
+                logger.info(f"{symbol}: {event['event_name']} {year}: {kept}")
+                all_videos.append(best)
+            else:
+                logger.info(f"{symbol}: {event['event_name']} {year}: none relevant")
+
+        # The same video can win several years; keep its best-scored pick
         all_videos = deduplicate_videos(all_videos)
 
         # Sort by relevance score (highest first)
@@ -231,7 +471,9 @@ def fetch_company_videos(
         }
 
         event_videos_list.append(event_videos)
-        print(f"    Final: {len(all_videos)} videos (after dedup + judge)")
+        logger.info(
+            f"{symbol}: {event['event_name']}: {len(all_videos)} videos (after judge)"
+        )
 
     company_data: CompanyData = {
         "symbol": symbol,
@@ -242,6 +484,71 @@ def fetch_company_videos(
     return company_data
 
 
+async def _process_companies(
+    groq_client: Groq,
+    companies: list[dict],
+    years: range,
+    all_company_data: list[CompanyData],
+    completed_symbols: set[str],
+) -> None:
+    """Fetch COMPANY_CONCURRENCY companies at a time, checkpointing as each
+    one finishes. No new company starts once a stop is requested."""
+    sem = asyncio.Semaphore(COMPANY_CONCURRENCY)
+    # Videos already chosen for some company, including resumed ones; a
+    # plain set is small enough (one id per chosen video)
+    accepted_ids = {
+        video["video_id"]
+        for company_data in all_company_data
+        for event in company_data["events"]
+        for video in event["videos"]
+    }
+
+    async def worker(i: int, company: dict) -> tuple[dict, CompanyData | None]:
+        async with sem:
+            if _stop_requested:
+                return company, None
+
+            logger.info(
+                f"[{i}/{len(companies)}] {company['symbol']} - {company['name']}"
+            )
+            try:
+                company_data = await fetch_company_videos(
+                    groq_client,
+                    company["symbol"],
+                    company["name"],
+                    company["sector"],
+                    years,
+                    accepted_ids,
+                )
+            except Exception as e:
+                logger.error(f"Error processing {company['name']}: {e}")
+                return company, None
+            return company, company_data
+
+    workers = [worker(i, company) for i, company in enumerate(companies, 1)]
+    for next_done in asyncio.as_completed(workers):
+        company, company_data = await next_done
+        if company_data is None:
+            continue
+        all_company_data.append(company_data)
+        completed_symbols.add(company["symbol"])
+        accepted_ids.update(
+            video["video_id"]
+            for event in company_data["events"]
+            for video in event["videos"]
+        )
+
+        # Checkpoint after every company
+        _save_checkpoint(company_data, completed_symbols)
+        logger.info(
+            f"{company['symbol']}: checkpoint saved — "
+            f"{len(completed_symbols)} companies done"
+        )
+
+    if _stop_requested:
+        logger.info("Stopped before starting the remaining companies.")
+
+
 def main():
     global _stop_requested
     load_dotenv()
@@ -268,14 +575,25 @@ def main():
     csv_path = "data/sp500.csv"
 
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            # Plain rows with the column positions looked up once, rather than
+            # a dict per row from DictReader
+            reader = csv.reader(f)
+            header = next(reader)
+            sym_i, name_i = header.index("Symbol"), header.index("Shortname")
+            sec_i = header.index("Sector") if "Sector" in header else None
+            min_len = max(sym_i, name_i) + 1
             for row in reader:
+                # DictReader skipped blank lines; skip those and truncated rows
+                if len(row) < min_len:
+                    continue
                 companies.append(
                     {
-                        "symbol": row["Symbol"],
-                        "name": row["Shortname"],
-                        "sector": row.get("Sector", ""),
+                        "symbol": row[sym_i],
+                        "name": row[name_i],
+                        "sector": (
+                            row[sec_i] if sec_i is not None and sec_i < len(row) else ""
+                        ),
                     }
                 )
     except FileNotFoundError:
@@ -301,7 +619,7 @@ def main():
     os.makedirs("out", exist_ok=True)
 
     # ---- Resume from checkpoint if available ----
-    all_company_data, completed_symbols = _load_checkpoint(output_file)
+    all_company_data, completed_symbols = _load_checkpoint()
 
     if completed_symbols:
         remaining = [c for c in companies if c["symbol"] not in completed_symbols]
@@ -316,55 +634,56 @@ def main():
             # Start fresh
             all_company_data = []
             completed_symbols = set()
+            _clear_checkpoint()
     else:
+        # Nothing resumable; drop any stale progress file so it isn't appended to
+        _clear_checkpoint()
         print()
 
     print(f"Processing {len(companies)} companies")
-    print("(Press Ctrl+C to stop after the current company and save progress)\n")
+    print(f"{COMPANY_CONCURRENCY} companies at a time")
+    print("(Press Ctrl+C to stop after the in-flight companies and save progress)\n")
 
-    # Install signal handler for graceful shutdown
+    # Install signal handler for graceful shutdown (asyncio.run keeps a
+    # non-default SIGINT handler)
     original_sigint = signal.getsignal(signal.SIGINT)
     signal.signal(signal.SIGINT, _signal_handler)
 
-    # Fetch videos for each company
-    for i, company in enumerate(companies, 1):
-        # Check if stop was requested between companies
-        if _stop_requested:
-            print(f"\nStopping before company {i}/{len(companies)}.")
-            break
-
-        print(f"\n{'=' * 60}")
-        print(f"[{i}/{len(companies)}] {company['symbol']} - {company['name']}")
+    # Progress is logged from worker threads and concurrent company tasks;
+    # records are queued and written to stdout by the listener thread, so log
+    # I/O never blocks the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
+    log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
 
-        try:
-            company_data = fetch_company_videos(
+    # Fetch videos for each company, all on one event loop
+    try:
+        asyncio.run(
+            _process_companies(
                 groq_client,
-                company["symbol"],
-                company["name"],
-                company["sector"],
+                companies,
                 years,
+                all_company_data,
+                completed_symbols,
             )
-            all_company_data.append(company_data)
-            completed_symbols.add(company["symbol"])
-
-            # Checkpoint after every company
-            _save_checkpoint(all_company_data, completed_symbols, output_file)
-            print(f"  [checkpoint saved — {len(completed_symbols)} companies done]")
-
-        except Exception as e:
-            print(f"Error processing {company['name']}: {e}")
-            continue
+        )
+    finally:
+        log_listener.stop()
 
     # Restore original signal handler
     signal.signal(signal.SIGINT, original_sigint)
 
-    # Final save (same as checkpoint but also clean up checkpoint file if done)
-    _save_checkpoint(all_company_data, completed_symbols, output_file)
+    # Final save: the full JSON array, written once; the checkpoint files
+    # are only kept while there is something left to resume
+    _write_output(all_company_data, output_file)
 
     all_done = not _stop_requested
     if all_done and os.path.exists(CHECKPOINT_FILE):
-        os.remove(CHECKPOINT_FILE)
-        print("\nAll companies processed — checkpoint file removed.")
+        _clear_checkpoint()
+        print("\nAll companies processed — checkpoint files removed.")
 
     print(f"\n{'=' * 60}")
     print(f"Results saved to {output_file}")
@@ -1,13 +1,19 @@
 """Prompt template loader."""
 
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 
 _PROMPTS_DIR = Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
     """Load a prompt template from a .txt file.
 
+    Each template is read from disk once per process; call
+    load_prompt.cache_clear() to pick up edits.
+
     Args:
         name: Filename without extension (e.g. "judge_system").
 
@@ -16,3 +22,18 @@ def load_prompt(name: str) -> str:
     """
     path = _PROMPTS_DIR / f"{name}.txt"
     return path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def prompt_hash(*names: str) -> str:
+    """SHA-256 over the named prompt templates.
+
+    Use it in cache keys so cached LLM output is dropped when a prompt changes.
+    """
+    digest = hashlib.sha256()
+    for name in names:
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(load_prompt(name).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
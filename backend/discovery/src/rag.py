@@ -2,10 +2,13 @@
 
 import os
 import json
+import logging
 from typing import TypedDict
 from groq import Groq
 from prompts import load_prompt
 
+logger = logging.getLogger(__name__)
+
 
 class CompanyEvent(TypedDict):
     """Information about a company event."""
@@ -99,7 +102,7 @@ def discover_company_events(
                 for tc in msg.tool_calls:
                     if tc.function.name == "web_search":
                         args = json.loads(tc.function.arguments)
-                        print(f"  Searching: {args['query']}")
+                        logger.info(f"{symbol}: searching: {args['query']}")
                         result = _web_search(args["query"])
                         messages.append(
                             {
@@ -149,15 +152,17 @@ def discover_company_events(
         )
 
     except json.JSONDecodeError as e:
-        print(f"Error parsing Groq response for {company_name}: {e}")
-        print(f"Response was: {response_text}")
+        logger.error(
+            f"Error parsing Groq response for {company_name}: {e}\n"
+            f"Response was: {response_text}"
+        )
         return CompanyEvents(
             symbol=symbol,
             company_name=company_name,
             events=[],
         )
     except Exception as e:
-        print(f"Error discovering events for {company_name}: {e}")
+        logger.error(f"Error discovering events for {company_name}: {e}")
         return CompanyEvents(
             symbol=symbol,
             company_name=company_name,
@@ -190,4 +195,5 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
 
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
@@ -10,6 +10,10 @@ import requests
 
 DEFAULT_API = "https://api.totsuki.harvey-l.com"
 
+# One keep-alive connection for the whole push instead of a new TCP/TLS
+# handshake per proposition
+_session = requests.Session()
+
 
 def create_video(api: str, video_id: str, title: str, description: str,
                  video_url: str, video_path: str, time: str) -> dict:
@@ -21,7 +25,7 @@ def create_video(api: str, video_id: str, title: str, description: str,
         "video_url": video_url,
         "time": time,
     }
-    resp = requests.post(f"{api}/videos", json=payload)
+    resp = _session.post(f"{api}/videos", json=payload)
     resp.raise_for_status()
     return resp.json()
 
@@ -34,7 +38,7 @@ def create_proposition(api: str, speaker_id: str, statement: str,
         "video_id": video_id,
         "verify_at": verify_at,
     }
-    resp = requests.post(f"{api}/propositions", json=payload)
+    resp = _session.post(f"{api}/propositions", json=payload)
     resp.raise_for_status()
     return resp.json()
 